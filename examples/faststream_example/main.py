@@ -17,10 +17,12 @@ from examples.probes import (
 from fast_healthchecks.integrations.base import Probe, build_probe_route_options
 from fast_healthchecks.integrations.faststream import health, healthcheck_shutdown
 
-broker = KafkaBroker(
+_KAFKA_BOOTSTRAP_SERVERS: tuple[str, ...] = tuple(
     os.environ.get("KAFKA_BOOTSTRAP_SERVERS", "localhost:9094,localhost:9095").split(","),
 )
 
+broker = KafkaBroker(_KAFKA_BOOTSTRAP_SERVERS)
+
 _probes_integration = (
     Probe(name="liveness", checks=LIVENESS_CHECKS),
     Probe(name="readiness", checks=READINESS_CHECKS),
@@ -22,6 +22,8 @@ from fast_healthchecks.integrations.base import ProbeAsgiResponse
 
 _ = load_dotenv(Path(__file__).parent.parent / ".env")
 
+_OPENSEARCH_HOSTS: tuple[str, ...] = tuple(os.environ["OPENSEARCH_HOSTS"].split(","))
+
 
 def sync_dummy_check() -> bool:
     """Run a synchronous dummy check that sleeps briefly and returns True.
@@ -69,7 +71,7 @@ def get_readiness_checks() -> list[Check]:
             name="Kafka",
         ),
         MongoHealthCheck.from_dsn(os.environ["MONGO_DSN"], name="Mongo"),
-        OpenSearchHealthCheck(hosts=os.environ["OPENSEARCH_HOSTS"].split(","), name="OpenSearch"),
+        OpenSearchHealthCheck(hosts=list(_OPENSEARCH_HOSTS), name="OpenSearch"),
         PostgreSQLAsyncPGHealthCheck.from_dsn(os.environ["POSTGRES_DSN"], name="PostgreSQL asyncpg"),
         PostgreSQLPsycopgHealthCheck.from_dsn(os.environ["POSTGRES_DSN"], name="PostgreSQL psycopg"),
         RabbitMQHealthCheck.from_dsn(os.environ["RABBITMQ_DSN"], name="RabbitMQ"),
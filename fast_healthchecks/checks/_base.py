@@ -10,10 +10,10 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import functools
+import re
 from abc import ABC, abstractmethod
 from traceback import format_exc
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, ParamSpec, Protocol, TypeVar, cast
-from urllib.parse import urlsplit
 
 from fast_healthchecks.models import HealthCheckResult
 from fast_healthchecks.utils import maybe_redact
@@ -41,6 +41,13 @@ __all__ = (
 
 DEFAULT_HC_TIMEOUT: float = 5.0
 
+# Extra seconds an outer asyncio deadline waits past a driver's own timeout, so the driver's error
+# (with its diagnostics) wins over a bare TimeoutError when both would fire at the same moment.
+_DRIVER_TIMEOUT_SLACK: float = 1.0
+
+# RFC 3986 scheme followed by ":"; only the scheme is needed to validate a DSN.
+_DSN_SCHEME_RE = re.compile(r"([A-Za-z][A-Za-z0-9+.\-]*):")
+
 _CLIENT_CACHING_SLOTS: tuple[str, str, str, str] = (
     "_client",
     "_client_loop",
@@ -58,6 +65,26 @@ def result_on_error(name: str) -> HealthCheckResult:
     return HealthCheckResult(name=name, healthy=False, error_details=format_exc())
 
 
+@functools.cache
+def _lowered_schemes(allowed_schemes: tuple[str, ...]) -> frozenset[str]:
+    """Return allowed DSN schemes lowercased; cached since each check class passes a constant tuple.
+
+    Returns:
+        frozenset[str]: Lowercased schemes.
+    """
+    return frozenset(s.lower() for s in allowed_schemes)
+
+
+@functools.cache
+def _schemes_display(allowed_schemes: tuple[str, ...]) -> str:
+    """Return allowed DSN schemes as a sorted, comma-separated string for error messages.
+
+    Returns:
+        str: Lowercased schemes joined with ", ".
+    """
+    return ", ".join(sorted(_lowered_schemes(allowed_schemes)))
+
+
 class _HasName(Protocol):
     _name: str
 
@@ -88,6 +115,27 @@ def healthcheck_safe(
     def decorator(
         method: Callable[Concatenate[_HasName, P], Awaitable[HealthCheckResult]],
     ) -> Callable[Concatenate[_HasName, P], Awaitable[HealthCheckResult]]:
+        # Pick the wrapper once at decoration time instead of branching on every failure.
+        if invalidate_on_error:
+
+            @functools.wraps(method)
+            async def invalidating_wrapper(
+                self: _HasName,
+                *args: P.args,
+                **kwargs: P.kwargs,
+            ) -> HealthCheckResult:
+                try:
+                    return await method(self, *args, **kwargs)
+                except (asyncio.CancelledError, SystemExit, KeyboardInterrupt):
+                    raise
+                except Exception:  # noqa: BLE001
+                    invalidate = getattr(self, "_invalidate_client", None)
+                    if callable(invalidate):
+                        await invalidate()
+                    return result_on_error(self._name)
+
+            return invalidating_wrapper
+
         @functools.wraps(method)
         async def wrapper(
             self: _HasName,
@@ -99,10 +147,6 @@ def healthcheck_safe(
             except (asyncio.CancelledError, SystemExit, KeyboardInterrupt):
                 raise
             except Exception:  # noqa: BLE001
-                if invalidate_on_error:
-                    invalidate = getattr(self, "_invalidate_client", None)
-                    if callable(invalidate):
-                        await invalidate()
                 return result_on_error(self._name)
 
         return wrapper
@@ -113,6 +157,8 @@ def healthcheck_safe(
 class ToDictMixin(ABC):
     """Mixin for health checks that support serialization to dict."""
 
+    __slots__ = ()
+
     @abstractmethod
     def _build_dict(self) -> dict[str, Any]:
         """Return the check attributes as a dictionary (without redaction)."""
@@ -133,6 +179,8 @@ class ToDictMixin(ABC):
 class ConfigDictMixin(ToDictMixin):
     """Mixin that implements _build_dict from _config.to_dict() and _name."""
 
+    __slots__ = ()
+
     _config: _ConfigWithToDict
     _name: str
 
@@ -145,11 +193,14 @@ class ClientCachingMixin(ABC, Generic[ClientT]):
     """Mixin for health checks that cache a client and need lifecycle management.
 
     Use this mixin for checks that maintain a long-lived client (Redis, Kafka,
-    Mongo, Url, OpenSearch, RabbitMQ). Implement _create_client (returning
-    ClientT or Awaitable[ClientT]) and pass close_client_fn to __init__.
+    Mongo, Url, OpenSearch, RabbitMQ, PostgreSQL via asyncpg). Implement
+    _create_client (returning ClientT or Awaitable[ClientT]) and pass
+    close_client_fn to __init__.
     Register probes with healthcheck_shutdown() so cached clients are closed.
     """
 
+    __slots__ = ()
+
     _client: ClientT | None
     _client_loop: asyncio.AbstractEventLoop | None
     _ensure_client_lock: asyncio.Lock
@@ -175,38 +226,42 @@ class ClientCachingMixin(ABC, Generic[ClientT]):
     async def aclose(self) -> None:
         """Close the cached client if present.
 
-        Yields once so the event loop can run transport cleanup callbacks
-        (e.g. aiohttp connection_lost) before returning.
+        After closing a client, yields once so the event loop can run transport
+        cleanup callbacks (e.g. aiohttp connection_lost) before returning.
         """
         async with self._ensure_client_lock:
-            if self._client is not None:
-                await self._close_client_fn(self._client)
-                self._client = None
-                self._client_loop = None
+            if self._client is None:
+                return
+            await self._close_client_fn(self._client)
+            self._client = None
+            self._client_loop = None
         await asyncio.sleep(0)
 
     async def _ensure_client(self) -> ClientT:
         """Return cached client, creating or recreating if needed.
 
+        The cached client is returned without taking the lock when it is bound
+        to the running loop; the lock is only taken to create or rebind it.
+
         Raises:
             RuntimeError: If client creation fails (e.g. _create_client returns None).
         """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        client = self._client
+        if client is not None and self._client_loop is running:
+            return client
         async with self._ensure_client_lock:
-            try:
-                running = asyncio.get_running_loop()
-            except RuntimeError:
-                running = None
+            # Another caller may have created the client while we waited for the lock.
             if self._client is not None and self._client_loop is not running:
                 with contextlib.suppress(Exception):
                     await self._close_client_fn(self._client)
                 self._client = None
                 self._client_loop = None
             if self._client is None:
-                try:
-                    self._client_loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    self._client_loop = None
-
+                self._client_loop = running
                 client_or_awaitable = self._create_client()
                 if asyncio.iscoroutine(client_or_awaitable):
                     self._client = cast("ClientT", await client_or_awaitable)
@@ -231,6 +286,8 @@ class ClientCachingMixin(ABC, Generic[ClientT]):
 class HealthCheck(Protocol[T_co]):
     """Base class for health checks."""
 
+    __slots__ = ()
+
     async def __call__(self) -> T_co: ...
 
 
@@ -246,6 +303,8 @@ class HealthCheckDSN(ConfigDictMixin, HealthCheck[T_co], Generic[T_co, T_parsed]
     T_parsed is the type returned by parse_dsn() and accepted by _from_parsed_dsn().
     """
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def _allowed_schemes(cls) -> tuple[str, ...]:
@@ -324,13 +383,13 @@ class HealthCheckDSN(ConfigDictMixin, HealthCheck[T_co], Generic[T_co, T_parsed]
             msg = "allowed_schemes cannot be empty"
             raise ValueError(msg) from None
 
-        parsed = urlsplit(dsn)
-        scheme = (parsed.scheme or "").lower()
+        match = _DSN_SCHEME_RE.match(dsn)
+        scheme = match.group(1).lower() if match else ""
         base_scheme = scheme.split("+", 1)[0] if "+" in scheme else scheme
 
-        allowed_set = frozenset(s.lower() for s in allowed_schemes)
+        allowed_set = _lowered_schemes(allowed_schemes)
         if scheme not in allowed_set and base_scheme not in allowed_set:
-            schemes_str = ", ".join(sorted(allowed_set))
+            schemes_str = _schemes_display(allowed_schemes)
             msg = f"DSN scheme must be one of {schemes_str} (or compound e.g. postgresql+driver), got {scheme!r}"
             raise ValueError(msg) from None
 
@@ -0,0 +1,93 @@
+"""Health check wrapper that reuses the last result for a fixed time.
+
+CachedHealthCheck wraps any check and returns its last result until ``ttl``
+seconds have passed since that result was produced. Concurrent callers share
+a single in-flight run of the wrapped check.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, final
+
+from fast_healthchecks.checks._base import HealthCheck
+from fast_healthchecks.models import HealthCheckResult
+
+if TYPE_CHECKING:
+    from fast_healthchecks.checks.types import Check
+
+
+@final
+class CachedHealthCheck(HealthCheck[HealthCheckResult]):
+    """Health check that caches the result of another check for ``ttl`` seconds.
+
+    Use it for checks shared by several probes (e.g. readiness and startup) or
+    for backends that should not be hit on every probe request. Failed results
+    are cached too, so an unavailable backend is not flooded with retries.
+    ``aclose()`` clears the cache and closes the wrapped check.
+    """
+
+    __slots__ = ("_check", "_expires_at", "_inflight", "_name", "_result", "_ttl")
+
+    _check: Check
+    _ttl: float
+    _name: str
+    _result: HealthCheckResult | None
+    _expires_at: float
+    _inflight: asyncio.Task[HealthCheckResult] | None
+
+    def __init__(self, check: Check, *, ttl: float, name: str | None = None) -> None:
+        """Initialize the CachedHealthCheck.
+
+        Args:
+            check: The check to run when the cached result is missing or expired.
+            ttl: Seconds to reuse a result, counted from when the wrapped check finished.
+            name: The name of the health check. Defaults to the wrapped check's name.
+
+        Raises:
+            ValueError: When ttl is negative.
+        """
+        if ttl < 0:
+            msg = f"ttl must be non-negative, got {ttl!r}"
+            raise ValueError(msg) from None
+        self._check = check
+        self._ttl = ttl
+        self._name = name or getattr(check, "name", None) or getattr(check, "_name", "Cached")
+        self._result = None
+        self._expires_at = 0.0
+        self._inflight = None
+
+    async def __call__(self) -> HealthCheckResult:
+        """Return the cached result, or run the wrapped check when it has expired.
+
+        Returns:
+            HealthCheckResult: The result of the wrapped check.
+        """
+        result = self._result
+        if result is not None and time.monotonic() < self._expires_at:
+            return result
+        inflight = self._inflight
+        if inflight is None or inflight.get_loop() is not asyncio.get_running_loop():
+            inflight = asyncio.ensure_future(self._run())
+            self._inflight = inflight
+        # Shield so one cancelled caller does not cancel the run other callers await.
+        return await asyncio.shield(inflight)
+
+    async def _run(self) -> HealthCheckResult:
+        try:
+            result = await self._check()
+            # Expiry counts from completion so slow checks are not re-run back to back.
+            self._result = result
+            self._expires_at = time.monotonic() + self._ttl
+            return result
+        finally:
+            self._inflight = None
+
+    async def aclose(self) -> None:
+        """Clear the cached result and close the wrapped check if it has ``aclose()``."""
+        self._result = None
+        self._expires_at = 0.0
+        aclose = getattr(self._check, "aclose", None)
+        if callable(aclose):
+            await aclose()
@@ -6,20 +6,34 @@ and centralize serialization for to_dict().
 
 from __future__ import annotations
 
-import ssl as _ssl  # noqa: TC003
-from dataclasses import asdict, dataclass, field
+import ssl as _ssl
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any, Literal, TypeAlias
 
 from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT
 
 SecurityProtocol: TypeAlias = Literal["SSL", "PLAINTEXT", "SASL_PLAINTEXT", "SASL_SSL"]
 SaslMechanism: TypeAlias = Literal["PLAIN", "GSSAPI", "SCRAM-SHA-256", "SCRAM-SHA-512", "OAUTHBEARER"]
+SslContextFactory: TypeAlias = Callable[[], _ssl.SSLContext]
 
 VALID_SECURITY_PROTOCOLS: frozenset[str] = frozenset({"SSL", "PLAINTEXT", "SASL_PLAINTEXT", "SASL_SSL"})
 VALID_SASL_MECHANISMS: frozenset[str] = frozenset({"PLAIN", "GSSAPI", "SCRAM-SHA-256", "SCRAM-SHA-512", "OAUTHBEARER"})
 
 
-@dataclass(frozen=True)
+def resolve_ssl_context(value: _ssl.SSLContext | SslContextFactory | None) -> _ssl.SSLContext | None:
+    """Return the SSL context, calling the factory when one was configured instead of a context.
+
+    Args:
+        value: An SSL context, a zero-argument callable returning one, or None.
+
+    Returns:
+        ssl.SSLContext | None: The SSL context to connect with.
+    """
+    return value() if callable(value) else value
+
+
+@dataclass(frozen=True, slots=True)
 class RedisConfig:
     """Configuration for Redis health check."""
 
@@ -34,15 +48,28 @@ class RedisConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Return config as a dict for serialization."""
-        return asdict(self)
+        return {
+            "host": self.host,
+            "port": self.port,
+            "database": self.database,
+            "user": self.user,
+            "password": self.password,
+            "ssl": self.ssl,
+            "ssl_ca_certs": self.ssl_ca_certs,
+            "timeout": self.timeout,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KafkaConfig:
-    """Configuration for Kafka health check."""
+    """Configuration for Kafka health check.
+
+    ``ssl_context`` may be a zero-argument callable; it is called once, when the
+    check first creates its client, so the context is not built for checks that never run.
+    """
 
     bootstrap_servers: str = "localhost:9092"
-    ssl_context: _ssl.SSLContext | None = None
+    ssl_context: _ssl.SSLContext | SslContextFactory | None = None
     security_protocol: SecurityProtocol = "PLAINTEXT"
     sasl_mechanism: SaslMechanism = "PLAIN"
     sasl_plain_username: str | None = None
@@ -76,7 +103,7 @@ class KafkaConfig:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MongoConfig:
     """Configuration for MongoDB health check."""
 
@@ -90,10 +117,19 @@ class MongoConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Return config as a dict for serialization."""
-        return asdict(self)
+        hosts = self.hosts
+        return {
+            "hosts": list(hosts) if isinstance(hosts, list) else hosts,
+            "port": self.port,
+            "user": self.user,
+            "password": self.password,
+            "database": self.database,
+            "auth_source": self.auth_source,
+            "timeout": self.timeout,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenSearchConfig:
     """Configuration for OpenSearch health check."""
 
@@ -107,10 +143,18 @@ class OpenSearchConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Return config as a dict for serialization."""
-        return asdict(self)
+        return {
+            "hosts": list(self.hosts),
+            "http_auth": self.http_auth,
+            "use_ssl": self.use_ssl,
+            "verify_certs": self.verify_certs,
+            "ssl_show_warn": self.ssl_show_warn,
+            "ca_certs": self.ca_certs,
+            "timeout": self.timeout,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RabbitMQConfig:
     """Configuration for RabbitMQ health check.
 
@@ -130,10 +174,18 @@ class RabbitMQConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Return config as a dict for serialization."""
-        return asdict(self)
+        return {
+            "host": self.host,
+            "port": self.port,
+            "user": self.user,
+            "password": self.password,
+            "vhost": self.vhost,
+            "secure": self.secure,
+            "timeout": self.timeout,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UrlConfig:
     """Configuration for URL health check.
 
@@ -154,19 +206,31 @@ class UrlConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Return config as a dict for serialization."""
-        return asdict(self)
+        return {
+            "url": self.url,
+            "username": self.username,
+            "password": self.password,
+            "verify_ssl": self.verify_ssl,
+            "follow_redirects": self.follow_redirects,
+            "timeout": self.timeout,
+            "block_private_hosts": self.block_private_hosts,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PostgresAsyncPGConfig:
-    """Configuration for PostgreSQL health check (asyncpg driver)."""
+    """Configuration for PostgreSQL health check (asyncpg driver).
+
+    ``ssl`` may be a zero-argument callable; it is called once, on the first
+    health check run, so the context is not built for checks that never run.
+    """
 
     host: str = "localhost"
     port: int = 5432
     user: str | None = None
     password: str | None = None
     database: str | None = None
-    ssl: _ssl.SSLContext | None = None
+    ssl: _ssl.SSLContext | SslContextFactory | None = None
     direct_tls: bool = False
     timeout: float = DEFAULT_HC_TIMEOUT
 
@@ -185,7 +249,7 @@ class PostgresAsyncPGConfig:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PostgresPsycopgConfig:
     """Configuration for PostgreSQL health check (psycopg driver)."""
 
@@ -202,10 +266,21 @@ class PostgresPsycopgConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Return config as a dict for serialization."""
-        return asdict(self)
+        return {
+            "host": self.host,
+            "port": self.port,
+            "user": self.user,
+            "password": self.password,
+            "database": self.database,
+            "sslmode": self.sslmode,
+            "sslcert": self.sslcert,
+            "sslkey": self.sslkey,
+            "sslrootcert": self.sslrootcert,
+            "timeout": self.timeout,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionConfig:
     """Configuration for function health check."""
 
@@ -215,10 +290,12 @@ class FunctionConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Return config as a dict for serialization."""
-        d = asdict(self)
-        d["args"] = list(d.get("args") or ())
-        d["kwargs"] = dict(d["kwargs"]) if d.get("kwargs") else {}
-        return d
+        # Shallow copies: user-supplied args/kwargs may hold objects that must not be deep-copied.
+        return {
+            "args": list(self.args),
+            "kwargs": dict(self.kwargs) if self.kwargs else {},
+            "timeout": self.timeout,
+        }
 
 
 __all__ = (
@@ -234,5 +311,7 @@ __all__ = (
     "RedisConfig",
     "SaslMechanism",
     "SecurityProtocol",
+    "SslContextFactory",
     "UrlConfig",
+    "resolve_ssl_context",
 )
@@ -1,7 +1,8 @@
 """Health check that runs a user-provided callable (sync or async).
 
 FunctionHealthCheck runs the callable each time the check is executed; sync
-functions are run in a thread pool via run_in_executor.
+functions are run in a thread pool via run_in_executor unless they are marked
+non-blocking with ``run_in_executor=False``.
 """
 
 from __future__ import annotations
@@ -27,14 +28,19 @@ class FunctionHealthCheck(ConfigDictMixin, HealthCheck[HealthCheckResult]):
     Synchronous functions are run via ``loop.run_in_executor(executor, ...)``.
     The default executor is ``None`` (shared thread pool). Long-running blocking
     sync checks can exhaust the pool; pass a dedicated :class:`Executor` if needed.
+    Cheap, non-blocking sync checks can pass ``run_in_executor=False`` to be
+    called directly on the event loop instead.
     """
 
-    __slots__ = ("_config", "_executor", "_func", "_name")
+    __slots__ = ("_bound_func", "_config", "_executor", "_func", "_is_async", "_name", "_run_in_executor")
 
+    _bound_func: Callable[[], Any]
     _config: FunctionConfig
     _func: Callable[..., Any]
     _executor: Executor | None
+    _is_async: bool
     _name: str
+    _run_in_executor: bool
 
     def __init__(
         self,
@@ -43,6 +49,7 @@ class FunctionHealthCheck(ConfigDictMixin, HealthCheck[HealthCheckResult]):
         func: Callable[..., Any] | None = None,
         name: str = "Function",
         executor: Executor | None = None,
+        run_in_executor: bool = True,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
         """Initialize the FunctionHealthCheck.
@@ -52,6 +59,9 @@ class FunctionHealthCheck(ConfigDictMixin, HealthCheck[HealthCheckResult]):
             func: The function to perform the health check on (required if config is None).
             name: The name of the health check.
             executor: Executor for sync functions. Defaults to None (thread pool).
+            run_in_executor: If False, a sync function is called directly on the event
+                loop thread. Only for functions that never block; the timeout cannot
+                interrupt them.
             **kwargs: Passed to FunctionConfig when config is None (args, kwargs, timeout).
 
         Raises:
@@ -61,6 +71,7 @@ class FunctionHealthCheck(ConfigDictMixin, HealthCheck[HealthCheckResult]):
             kwargs_copy = dict(kwargs)
             func = kwargs_copy.pop("func", func)
             executor = kwargs_copy.pop("executor", executor)
+            run_in_executor = kwargs_copy.pop("run_in_executor", run_in_executor)
             if func is None:
                 msg = "func is required when config is not provided"
                 raise TypeError(msg)
@@ -70,30 +81,34 @@ class FunctionHealthCheck(ConfigDictMixin, HealthCheck[HealthCheckResult]):
             raise TypeError(msg)
         self._config = config
         self._func = func
+        # The config is frozen, so bind its args/kwargs once instead of on every call.
+        self._bound_func = (
+            functools.partial(func, *config.args, **config.kwargs) if config.args or config.kwargs else func
+        )
         self._executor = executor
+        self._is_async = inspect.iscoroutinefunction(func)
         self._name = name
+        self._run_in_executor = run_in_executor
 
     @healthcheck_safe(invalidate_on_error=False)
     async def __call__(self) -> HealthCheckResult:
         """Perform the health check on the function.
 
-        Sync functions run in the given executor (default: shared thread pool).
+        Sync functions run in the given executor (default: shared thread pool),
+        or inline when ``run_in_executor=False``.
 
         Returns:
             HealthCheckResult: The result of the health check.
         """
-        c = self._config
-        args = c.args or ()
-        kwargs = dict(c.kwargs) if c.kwargs else {}
+        timeout = self._config.timeout
         task: asyncio.Future[Any]
-        if inspect.iscoroutinefunction(self._func):
-            task = self._func(*args, **kwargs)
-        else:
+        if self._is_async:
+            result = await asyncio.wait_for(self._bound_func(), timeout=timeout)
+        elif self._run_in_executor:
             loop = asyncio.get_running_loop()
-            task = loop.run_in_executor(
-                self._executor,
-                functools.partial(self._func, *args, **kwargs),
-            )
-        result = await asyncio.wait_for(task, timeout=c.timeout)
+            task = loop.run_in_executor(self._executor, self._bound_func)
+            result = await asyncio.wait_for(task, timeout=timeout)
+        else:
+            result = self._bound_func()
         healthy = bool(result) if isinstance(result, bool) else True
         return HealthCheckResult(name=self._name, healthy=healthy)
@@ -17,27 +17,30 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import re
 from typing import TYPE_CHECKING, Any, cast, final
 from urllib.parse import unquote, urlsplit
 
 from fast_healthchecks.checks._base import (
     _CLIENT_CACHING_SLOTS,
+    _DRIVER_TIMEOUT_SLACK,
     DEFAULT_HC_TIMEOUT,
     ClientCachingMixin,
     HealthCheckDSN,
     healthcheck_safe,
 )
 from fast_healthchecks.checks._imports import raise_optional_import_error
-from fast_healthchecks.checks.configs import KafkaConfig
+from fast_healthchecks.checks.configs import KafkaConfig, resolve_ssl_context
 from fast_healthchecks.checks.dsn_parsing import KafkaParseDsnResult
 from fast_healthchecks.models import HealthCheckResult
 
 if TYPE_CHECKING:
-    import asyncio
     import ssl
     from collections.abc import Awaitable, Callable
 
-    from fast_healthchecks.checks.configs import SaslMechanism, SecurityProtocol
+    from fast_healthchecks.checks.configs import SaslMechanism, SecurityProtocol, SslContextFactory
 
 try:
     from aiokafka.admin import AIOKafkaAdminClient
@@ -45,10 +48,71 @@ except ImportError as exc:
     raise_optional_import_error("aiokafka", "aiokafka", exc)
 
 
+# Plain kafka[s]://[userinfo@]host:port[,host:port...] DSNs; anything else goes through urlsplit.
+_KAFKA_DSN_RE = re.compile(
+    r"(?P<scheme>(?i:kafkas?))://"
+    r"(?:(?P<userinfo>[A-Za-z0-9._~!$&'()*+,;=:%-]*)@)?"
+    r"(?P<hosts>[A-Za-z0-9._:,-]+)"
+    r"(?:[/?#].*)?",
+    re.DOTALL,
+)
+
+
 def _close_kafka_client(client: AIOKafkaAdminClient) -> Awaitable[None]:
     return client.close()
 
 
+def _split_kafka_dsn(dsn: str) -> tuple[str, str | None, str]:
+    """Split a Kafka DSN into lowercased scheme, raw userinfo (None when absent) and bootstrap servers.
+
+    Returns:
+        tuple[str, str | None, str]: Scheme, userinfo and bootstrap servers.
+    """
+    match = _KAFKA_DSN_RE.fullmatch(dsn)
+    if match is not None:
+        return match["scheme"].lower(), match["userinfo"], match["hosts"]
+    parsed = urlsplit(dsn)
+    netloc = parsed.netloc
+    userinfo: str | None = None
+    head, sep, tail = netloc.rpartition("@")
+    if sep:
+        userinfo, netloc = head, tail
+    return (parsed.scheme or "kafka").lower(), userinfo, netloc or parsed.path.lstrip("/")
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_kafka_dsn(dsn: str) -> tuple[str, str | None, str | None, str]:
+    """Parse a Kafka DSN into bootstrap servers, SASL username, SASL password and security protocol.
+
+    Results are cached by DSN; a tuple is cached so callers cannot mutate the cached value.
+
+    Returns:
+        tuple[str, str | None, str | None, str]: The parsed values.
+
+    Raises:
+        ValueError: If bootstrap servers are missing.
+    """
+    scheme, userinfo, bootstrap_servers = _split_kafka_dsn(dsn)
+    sasl_plain_username: str | None = None
+    sasl_plain_password: str | None = None
+    if userinfo is not None:
+        username, _, password = userinfo.partition(":")
+        sasl_plain_username = unquote(username) or None
+        sasl_plain_password = unquote(password) or None
+
+    if not bootstrap_servers:
+        msg = "Kafka DSN must include bootstrap servers"
+        raise ValueError(msg) from None
+
+    has_credentials = bool(sasl_plain_username or sasl_plain_password)
+    if scheme == "kafkas":
+        security_protocol = "SASL_SSL" if has_credentials else "SSL"
+    else:
+        security_protocol = "SASL_PLAINTEXT" if has_credentials else "PLAINTEXT"
+
+    return bootstrap_servers, sasl_plain_username, sasl_plain_password, security_protocol
+
+
 @final
 class KafkaHealthCheck(
     ClientCachingMixin["AIOKafkaAdminClient"],
@@ -67,10 +131,12 @@ class KafkaHealthCheck(
         _timeout: The timeout for the health check.
     """
 
-    __slots__ = (*_CLIENT_CACHING_SLOTS, "_config", "_name")
+    __slots__ = (*_CLIENT_CACHING_SLOTS, "_config", "_healthy_result", "_name", "_ssl_context")
 
     _config: KafkaConfig
     _name: str
+    _healthy_result: HealthCheckResult
+    _ssl_context: ssl.SSLContext | None
     _client: AIOKafkaAdminClient | None
     _client_loop: asyncio.AbstractEventLoop | None
 
@@ -94,15 +160,22 @@ class KafkaHealthCheck(
             config = KafkaConfig(**kwargs)
         self._config = config
         self._name = name
+        # HealthCheckResult is frozen, so every successful probe can return the same instance.
+        self._healthy_result = HealthCheckResult(name=name, healthy=True)
+        self._ssl_context = None
         super().__init__(close_client_fn=close_client_fn)
 
     def _create_client(self) -> AIOKafkaAdminClient:
         c = self._config
+        # Resolved on first use and kept, so a context factory is not called again on reconnect.
+        ssl_context = self._ssl_context
+        if ssl_context is None:
+            ssl_context = self._ssl_context = resolve_ssl_context(c.ssl_context)
         return AIOKafkaAdminClient(
             bootstrap_servers=c.bootstrap_servers,
             client_id="fast_healthchecks",
             request_timeout_ms=int(c.timeout * 1000),
-            ssl_context=c.ssl_context,
+            ssl_context=ssl_context,
             security_protocol=c.security_protocol,
             sasl_mechanism=c.sasl_mechanism,
             sasl_plain_username=c.sasl_plain_username,
@@ -130,35 +203,8 @@ class KafkaHealthCheck(
 
         Returns:
             KafkaParseDsnResult: The results of parsing the DSN.
-
-        Raises:
-            ValueError: If bootstrap servers are missing.
         """
-        parsed = urlsplit(dsn)
-        scheme = (parsed.scheme or "kafka").lower()
-        netloc = parsed.netloc
-        sasl_plain_username: str | None = None
-        sasl_plain_password: str | None = None
-        if "@" in netloc:
-            userinfo, hosts = netloc.rsplit("@", 1)
-            netloc = hosts
-            if ":" in userinfo:
-                username, password = userinfo.split(":", 1)
-                sasl_plain_username = unquote(username) or None
-                sasl_plain_password = unquote(password) or None
-            else:
-                sasl_plain_username = unquote(userinfo) or None
-
-        bootstrap_servers = netloc or parsed.path.lstrip("/")
-        if not bootstrap_servers:
-            msg = "Kafka DSN must include bootstrap servers"
-            raise ValueError(msg) from None
-
-        if scheme == "kafkas":
-            security_protocol = "SASL_SSL" if (sasl_plain_username or sasl_plain_password) else "SSL"
-        else:
-            security_protocol = "SASL_PLAINTEXT" if (sasl_plain_username or sasl_plain_password) else "PLAINTEXT"
-
+        bootstrap_servers, sasl_plain_username, sasl_plain_password, security_protocol = _parse_kafka_dsn(dsn)
         return {
             "bootstrap_servers": bootstrap_servers,
             "sasl_plain_username": sasl_plain_username,
@@ -177,7 +223,7 @@ class KafkaHealthCheck(
     ) -> KafkaHealthCheck:
         config = KafkaConfig(
             bootstrap_servers=parsed["bootstrap_servers"],
-            ssl_context=cast("ssl.SSLContext | None", kwargs.get("ssl_context")),
+            ssl_context=cast("ssl.SSLContext | SslContextFactory | None", kwargs.get("ssl_context")),
             security_protocol=cast(
                 "SecurityProtocol",
                 kwargs.get("security_protocol", parsed["security_protocol"]) or "PLAINTEXT",
@@ -196,7 +242,14 @@ class KafkaHealthCheck(
         Returns:
             HealthCheckResult: The result of the health check.
         """
+        # request_timeout_ms bounds single requests, not bootstrap as a whole; cap the probe so it cannot
+        # hang. The cap leaves some slack so the client's own connection errors are reported first.
+        # A timeout fails the check and drops the cached client.
+        return await asyncio.wait_for(self._probe(), timeout=self._config.timeout + _DRIVER_TIMEOUT_SLACK)
+
+    async def _probe(self) -> HealthCheckResult:
         client = await self._ensure_client()
         await client.start()
-        await client.list_topics()
-        return HealthCheckResult(name=self._name, healthy=True)
+        # An empty topic list requests broker metadata only; list_topics() would fetch every topic.
+        await client.describe_topics([])
+        return self._healthy_result
@@ -23,10 +23,11 @@ from __future__ import annotations
 
 import asyncio
 from typing import TYPE_CHECKING, Any, final
-from urllib.parse import urlsplit
+from urllib.parse import unquote, urlsplit
 
 from fast_healthchecks.checks._base import (
     _CLIENT_CACHING_SLOTS,
+    _DRIVER_TIMEOUT_SLACK,
     DEFAULT_HC_TIMEOUT,
     ClientCachingMixin,
     HealthCheckDSN,
@@ -36,28 +37,23 @@ from fast_healthchecks.checks._imports import raise_optional_import_error
 from fast_healthchecks.checks.configs import MongoConfig
 from fast_healthchecks.checks.dsn_parsing import MongoParseDsnResult
 from fast_healthchecks.models import HealthCheckResult
-from fast_healthchecks.utils import parse_query_string
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
+    from motor.motor_asyncio import AsyncIOMotorDatabase
+
 try:
     from motor.motor_asyncio import AsyncIOMotorClient
 except ImportError as exc:
     raise_optional_import_error("motor", "motor", exc)
 
 
-def _close_mongo_client(
-    client: AsyncIOMotorClient[dict[str, Any]],
-) -> Awaitable[None]:
+async def _close_mongo_client(client: AsyncIOMotorClient[dict[str, Any]]) -> None:
+    # Motor 3.x closes synchronously; await only if a client returns a coroutine.
     result = client.close()
     if asyncio.iscoroutine(result):
-        return result
-
-    async def _noop() -> None:
-        pass
-
-    return _noop()
+        await result
 
 
 @final
@@ -78,10 +74,12 @@ class MongoHealthCheck(
         _user: The MongoDB user.
     """
 
-    __slots__ = (*_CLIENT_CACHING_SLOTS, "_config", "_name")
+    __slots__ = (*_CLIENT_CACHING_SLOTS, "_config", "_healthy_result", "_name", "_ping_target")
 
     _config: MongoConfig
     _name: str
+    _healthy_result: HealthCheckResult
+    _ping_target: tuple[AsyncIOMotorClient[dict[str, Any]], AsyncIOMotorDatabase[dict[str, Any]]] | None
     _client: AsyncIOMotorClient[dict[str, Any]] | None
     _client_loop: asyncio.AbstractEventLoop | None
 
@@ -108,6 +106,9 @@ class MongoHealthCheck(
             config = MongoConfig(**kwargs)
         self._config = config
         self._name = name
+        # HealthCheckResult is frozen, so every successful probe can return the same instance.
+        self._healthy_result = HealthCheckResult(name=name, healthy=True)
+        self._ping_target = None
         super().__init__(close_client_fn=close_client_fn)
 
     def _create_client(self) -> AsyncIOMotorClient[dict[str, Any]]:
@@ -121,6 +122,15 @@ class MongoHealthCheck(
             serverSelectionTimeoutMS=int(c.timeout * 1000),
         )
 
+    async def aclose(self) -> None:
+        """Close the cached client if present and drop the database proxy bound to it."""
+        self._ping_target = None
+        await super().aclose()
+
+    async def _invalidate_client(self) -> None:
+        self._ping_target = None
+        await super()._invalidate_client()
+
     @classmethod
     def _allowed_schemes(cls) -> tuple[str, ...]:
         return ("mongodb", "mongodb+srv")
@@ -140,8 +150,13 @@ class MongoHealthCheck(
             MongoParseDsnResult: The results of parsing the DSN.
         """
         parse_result = urlsplit(dsn)
-        query = parse_query_string(parse_result.query)
-        return {"parse_result": parse_result, "authSource": query.get("authSource", "admin")}
+        # Only authSource is used, so scan for it instead of decoding the whole query; the last one wins.
+        auth_source = "admin"
+        for part in parse_result.query.split("&"):
+            key, _, value = part.partition("=")
+            if key == "authSource":
+                auth_source = unquote(value)
+        return {"parse_result": parse_result, "authSource": auth_source}
 
     @classmethod
     def _from_parsed_dsn(
@@ -179,9 +194,19 @@ class MongoHealthCheck(
         Returns:
             HealthCheckResult: The result of the health check.
         """
+        # serverSelectionTimeoutMS does not bound the ping once a server is selected; cap the whole probe.
+        # The cap leaves some slack so a ServerSelectionTimeoutError with its topology details is reported.
+        return await asyncio.wait_for(self._probe(), timeout=self._config.timeout + _DRIVER_TIMEOUT_SLACK)
+
+    async def _probe(self) -> HealthCheckResult:
         client = await self._ensure_client()
-        database = client[self._config.database] if self._config.database else client[self._config.auth_source]
-        res = await database.command("ping")
-        ok_raw = res.get("ok")
-        ok_value = ok_raw if isinstance(ok_raw, (bool, int, float)) else 0
-        return HealthCheckResult(name=self._name, healthy=int(ok_value) == 1)
+        # client[name] builds a new database proxy each time; keep it for as long as the client is cached.
+        target = self._ping_target
+        if target is None or target[0] is not client:
+            c = self._config
+            target = self._ping_target = (client, client[c.database or c.auth_source])
+        res = await target[1].command("ping")
+        # MongoDB replies with ok: 1.0; equality also accepts 1 and True, and rejects non-numeric values.
+        if res.get("ok") == 1:
+            return self._healthy_result
+        return HealthCheckResult(name=self._name, healthy=False)
@@ -21,11 +21,15 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import re
 from typing import TYPE_CHECKING, Any, cast, final
 from urllib.parse import unquote, urlsplit
 
 from fast_healthchecks.checks._base import (
     _CLIENT_CACHING_SLOTS,
+    _DRIVER_TIMEOUT_SLACK,
     DEFAULT_HC_TIMEOUT,
     ClientCachingMixin,
     HealthCheckDSN,
@@ -37,7 +41,6 @@ from fast_healthchecks.checks.dsn_parsing import OpenSearchParseDsnResult
 from fast_healthchecks.models import HealthCheckResult
 
 if TYPE_CHECKING:
-    import asyncio
     from collections.abc import Awaitable, Callable
 
 try:
@@ -46,10 +49,71 @@ except ImportError as exc:
     raise_optional_import_error("opensearch", "opensearch-py", exc)
 
 
+# Plain http[s]://[user[:password]@]host[:port][/...] DSNs without escapes; anything else goes through urlsplit.
+_OPENSEARCH_DSN_RE = re.compile(
+    r"(?P<scheme>(?i:https?))://"
+    r"(?:(?P<userinfo>[A-Za-z0-9._~!$&'()*+,;=:-]*)@)?"
+    r"(?P<host>[A-Za-z0-9.-]+)"
+    r"(?::(?P<port>[0-9]{0,5}))?"
+    r"(?:[/?#].*)?",
+    re.DOTALL,
+)
+_MAX_PORT = 65535
+
+
 def _close_opensearch_client(client: AsyncOpenSearch) -> Awaitable[None]:
     return client.close()
 
 
+def _split_opensearch_dsn(dsn: str) -> tuple[str, str | None, tuple[str, str] | None, int | None]:
+    """Split an OpenSearch DSN into lowercased scheme, hostname, decoded credentials and port.
+
+    Returns:
+        tuple[str, str | None, tuple[str, str] | None, int | None]: Scheme, hostname (None when
+        absent), username and password (None without userinfo) and port (None when absent).
+    """
+    match = _OPENSEARCH_DSN_RE.fullmatch(dsn)
+    if match is not None:
+        port_raw = match["port"]
+        port = int(port_raw) if port_raw else None
+        # Out-of-range ports go through urlsplit so they raise the same error as before.
+        if port is None or port <= _MAX_PORT:
+            userinfo = match["userinfo"]
+            http_auth: tuple[str, str] | None = None
+            if userinfo is not None:
+                username, _, password = userinfo.partition(":")
+                http_auth = (username, password)
+            return match["scheme"].lower(), match["host"].lower(), http_auth, port
+    parsed = urlsplit(dsn)
+    http_auth = None
+    if parsed.username is not None:
+        http_auth = (unquote(parsed.username), unquote(parsed.password or ""))
+    hostname = parsed.hostname
+    # A missing host is reported before an invalid port, so only read the port when there is a host.
+    return parsed.scheme, hostname, http_auth, parsed.port if hostname else None
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_opensearch_dsn(dsn: str) -> tuple[str, tuple[str, str] | None, bool]:
+    """Parse an OpenSearch DSN into a ``host:port`` string, HTTP auth and whether to use SSL.
+
+    Results are cached by DSN; a tuple is cached so callers cannot mutate the cached value.
+
+    Returns:
+        tuple[str, tuple[str, str] | None, bool]: The parsed values.
+
+    Raises:
+        ValueError: If DSN has missing host.
+    """
+    scheme, hostname, http_auth, port = _split_opensearch_dsn(dsn)
+    if not hostname:
+        msg = "OpenSearch DSN must include a host"
+        raise ValueError(msg) from None
+
+    use_ssl = scheme == "https"
+    return f"{hostname}:{port or (443 if use_ssl else 9200)}", http_auth, use_ssl
+
+
 @final
 class OpenSearchHealthCheck(
     ClientCachingMixin["AsyncOpenSearch"],
@@ -126,24 +190,12 @@ class OpenSearchHealthCheck(
 
         Returns:
             OpenSearchParseDsnResult: The results of parsing the DSN.
-
-        Raises:
-            ValueError: If DSN has missing host.
         """
-        parsed = urlsplit(dsn)
-        if not parsed.hostname:
-            msg = "OpenSearch DSN must include a host"
-            raise ValueError(msg) from None
-
-        http_auth: tuple[str, str] | None = None
-        if parsed.username is not None:
-            http_auth = (unquote(parsed.username), unquote(parsed.password or ""))
-
-        port = parsed.port or (443 if parsed.scheme == "https" else 9200)
+        host, http_auth, use_ssl = _parse_opensearch_dsn(dsn)
         return {
-            "hosts": [f"{parsed.hostname}:{port}"],
+            "hosts": [host],
             "http_auth": http_auth,
-            "use_ssl": parsed.scheme == "https",
+            "use_ssl": use_ssl,
         }
 
     @classmethod
@@ -174,5 +226,12 @@ class OpenSearchHealthCheck(
             HealthCheckResult: The result of the health check.
         """
         client = await self._ensure_client()
-        await client.info()
-        return HealthCheckResult(name=self._name, healthy=True)
+        # HEAD / has no response body to transfer and decode, unlike info(). It goes through the
+        # transport rather than ping(), which turns connection errors into False and hides their details.
+        # The client timeout applies per request attempt; cap the whole call, retries included. The cap
+        # leaves some slack so a ConnectionTimeout from the client is reported rather than a bare TimeoutError.
+        healthy = await asyncio.wait_for(
+            client.transport.perform_request("HEAD", "/"),
+            timeout=self._config.timeout + _DRIVER_TIMEOUT_SLACK,
+        )
+        return HealthCheckResult(name=self._name, healthy=healthy)
@@ -25,11 +25,18 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 from typing import TYPE_CHECKING, Any
 
-from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, healthcheck_safe
+from fast_healthchecks.checks._base import (
+    _CLIENT_CACHING_SLOTS,
+    DEFAULT_HC_TIMEOUT,
+    ClientCachingMixin,
+    healthcheck_safe,
+)
 from fast_healthchecks.checks._imports import raise_optional_import_error
-from fast_healthchecks.checks.configs import PostgresAsyncPGConfig
+from fast_healthchecks.checks.configs import PostgresAsyncPGConfig, resolve_ssl_context
 from fast_healthchecks.checks.postgresql.base import BasePostgreSQLHealthCheck
 from fast_healthchecks.models import HealthCheckResult
 
@@ -39,12 +46,24 @@ except ImportError as exc:
     raise_optional_import_error("asyncpg", "asyncpg", exc)
 
 if TYPE_CHECKING:
+    import ssl
+    from collections.abc import Awaitable, Callable
+
     from asyncpg.connection import Connection
 
     from fast_healthchecks.checks.dsn_parsing import PostgresParseDsnResult
 
 
-class PostgreSQLAsyncPGHealthCheck(BasePostgreSQLHealthCheck[HealthCheckResult]):
+async def _close_asyncpg_connection(connection: Connection, *, timeout: float = DEFAULT_HC_TIMEOUT) -> None:
+    if not connection.is_closed():
+        # asyncpg aborts the connection when a graceful close times out.
+        await connection.close(timeout=timeout)
+
+
+class PostgreSQLAsyncPGHealthCheck(
+    ClientCachingMixin["Connection"],
+    BasePostgreSQLHealthCheck[HealthCheckResult],
+):
     """Health check class for PostgreSQL using asyncpg.
 
     Attributes:
@@ -59,16 +78,21 @@ class PostgreSQLAsyncPGHealthCheck(BasePostgreSQLHealthCheck[HealthCheckResult])
         _timeout: The timeout for the connection.
     """
 
-    __slots__ = ("_config", "_name")
+    __slots__ = (*_CLIENT_CACHING_SLOTS, "_config", "_name", "_query_lock", "_ssl")
 
     _config: PostgresAsyncPGConfig
     _name: str
+    _query_lock: asyncio.Lock
+    _ssl: ssl.SSLContext | None
+    _client: Connection | None
+    _client_loop: asyncio.AbstractEventLoop | None
 
     def __init__(
         self,
         *,
         config: PostgresAsyncPGConfig | None = None,
         name: str = "PostgreSQL",
+        close_client_fn: Callable[[Connection], Awaitable[None]] | None = None,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
         """Initialize the PostgreSQLAsyncPGHealthCheck.
@@ -76,12 +100,36 @@ class PostgreSQLAsyncPGHealthCheck(BasePostgreSQLHealthCheck[HealthCheckResult])
         Args:
             config: Connection config. If None, built from kwargs (host, port, user, etc.).
             name: The name of the health check.
+            close_client_fn: Callable to close the cached connection. Defaults to a graceful
+                close bounded by the config timeout.
             **kwargs: Passed to PostgresAsyncPGConfig when config is None.
         """
         if config is None:
             config = PostgresAsyncPGConfig(**kwargs)
         self._config = config
         self._name = name
+        self._ssl = None
+        self._query_lock = asyncio.Lock()
+        if close_client_fn is None:
+            close_client_fn = functools.partial(_close_asyncpg_connection, timeout=config.timeout)
+        super().__init__(close_client_fn=close_client_fn)
+
+    def _create_client(self) -> Awaitable[Connection]:
+        c = self._config
+        # Resolved on the first connect and kept, so a context factory is called once.
+        ssl_context = self._ssl
+        if ssl_context is None:
+            ssl_context = self._ssl = resolve_ssl_context(c.ssl)
+        return asyncpg.connect(
+            host=c.host,
+            port=c.port,
+            user=c.user,
+            password=c.password,
+            database=c.database,
+            timeout=c.timeout,
+            ssl=ssl_context,
+            direct_tls=c.direct_tls,
+        )
 
     @classmethod
     def _from_parsed_dsn(
@@ -110,25 +158,23 @@ class PostgreSQLAsyncPGHealthCheck(BasePostgreSQLHealthCheck[HealthCheckResult])
     async def __call__(self) -> HealthCheckResult:
         """Perform the health check.
 
+        The connection is kept between calls and replaced after an error.
+        Overlapping calls run one at a time, since a connection runs one query at a time.
+
         Returns:
             HealthCheckResult: The result of the health check.
         """
-        c = self._config
-        connection: Connection | None = None
-        try:
-            connection = await asyncpg.connect(
-                host=c.host,
-                port=c.port,
-                user=c.user,
-                password=c.password,
-                database=c.database,
-                timeout=c.timeout,
-                ssl=c.ssl,
-                direct_tls=c.direct_tls,
-            )
-            async with connection.transaction(readonly=True):
-                healthy: bool = bool(await connection.fetchval("SELECT 1"))
-                return HealthCheckResult(name=self._name, healthy=healthy)
-        finally:
-            if connection is not None and not connection.is_closed():
-                await connection.close(timeout=c.timeout)
+        async with self._query_lock:
+            connection = await self._ensure_client()
+            if connection.is_closed():
+                # The server or network dropped the cached connection; reconnect instead of failing this probe.
+                await self._invalidate_client()
+                connection = await self._ensure_client()
+            try:
+                # A bare query runs in autocommit; a read-only transaction would add BEGIN and COMMIT round trips.
+                healthy: bool = bool(await connection.fetchval("SELECT 1", timeout=self._config.timeout))
+            except Exception:
+                # Dropped while holding the lock, so a waiting call never runs on a connection being closed.
+                await self._invalidate_client()
+                raise
+            return HealthCheckResult(name=self._name, healthy=healthy)
@@ -70,9 +70,37 @@ def create_ssl_context(
     return sslctx
 
 
+@lru_cache(maxsize=128)
+def _parse_postgres_dsn(dsn: str) -> tuple[SplitResult, str, str | None, str | None, str | None, bool]:
+    """Split a PostgreSQL DSN into its parts and the raw SSL query parameters.
+
+    Results are cached by DSN. The SSL context is not part of the cached value, so
+    ``create_ssl_context.cache_clear()`` still takes effect for DSNs parsed before.
+
+    Returns:
+        tuple[SplitResult, str, str | None, str | None, str | None, bool]: The split DSN, sslmode,
+        sslcert, sslkey, sslrootcert and direct_tls.
+    """
+    parse_result = urlsplit(dsn)
+    query = parse_query_string(parse_result.query)
+    sslcert_raw = query.get("sslcert")
+    sslkey_raw = query.get("sslkey")
+    sslrootcert_raw = query.get("sslrootcert")
+    return (
+        parse_result,
+        query.get("sslmode", "disable"),
+        unquote(sslcert_raw) if sslcert_raw else None,
+        unquote(sslkey_raw) if sslkey_raw else None,
+        unquote(sslrootcert_raw) if sslrootcert_raw else None,
+        query.get("direct_tls", "").lower() in {"1", "true", "yes", "on"},
+    )
+
+
 class BasePostgreSQLHealthCheck(HealthCheckDSN[T_co, PostgresParseDsnResult], Generic[T_co]):
     """Base class for PostgreSQL health checks."""
 
+    __slots__ = ()
+
     @classmethod
     def _allowed_schemes(cls) -> tuple[str, ...]:
         return ("postgresql", "postgres")
@@ -122,18 +150,9 @@ class BasePostgreSQLHealthCheck(HealthCheckDSN[T_co, PostgresParseDsnResult], Ge
         Returns:
             PostgresParseDsnResult: The results of parsing the DSN.
         """
-        parse_result: SplitResult = urlsplit(dsn)
-        query = parse_query_string(parse_result.query)
-        sslmode: SslMode = cls.validate_sslmode(query.get("sslmode", "disable"))
-        sslcert_raw: str | None = query.get("sslcert")
-        sslkey_raw: str | None = query.get("sslkey")
-        sslrootcert_raw: str | None = query.get("sslrootcert")
-        sslcert = unquote(sslcert_raw) if sslcert_raw else None
-        sslkey = unquote(sslkey_raw) if sslkey_raw else None
-        sslrootcert = unquote(sslrootcert_raw) if sslrootcert_raw else None
+        parse_result, sslmode_raw, sslcert, sslkey, sslrootcert, direct_tls = _parse_postgres_dsn(dsn)
+        sslmode: SslMode = cls.validate_sslmode(sslmode_raw)
         sslctx: ssl.SSLContext | None = create_ssl_context(sslmode, sslcert, sslkey, sslrootcert)
-        direct_tls_raw: str = query.get("direct_tls", "").lower()
-        direct_tls: bool = direct_tls_raw in {"1", "true", "yes", "on"}
         return {
             "parse_result": parse_result,
             "sslmode": sslmode,
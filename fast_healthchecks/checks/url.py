@@ -1,7 +1,9 @@
 """Health check that performs an HTTP GET to a URL.
 
 UrlHealthCheck caches an httpx AsyncClient and supports optional basic auth,
-SSL verification, and SSRF protection (block_private_hosts).
+SSL verification, and SSRF protection (block_private_hosts). The client keeps
+its connection alive between probe runs so repeated checks skip the TCP/TLS
+handshake.
 """
 
 from __future__ import annotations
@@ -23,7 +25,7 @@ from fast_healthchecks.models import HealthCheckResult
 from fast_healthchecks.utils import validate_host_ssrf_async, validate_url_ssrf
 
 try:
-    from httpx import AsyncClient, AsyncHTTPTransport, BasicAuth, Response
+    from httpx import AsyncClient, AsyncHTTPTransport, BasicAuth, Limits, Response
 except ImportError as exc:
     raise_optional_import_error("httpx", "httpx", exc)
 
@@ -32,6 +34,11 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
 
+# httpx drops idle connections after 5s by default, shorter than typical probe
+# intervals; keep one connection around long enough to be reused between probes.
+_KEEPALIVE_LIMITS = Limits(max_keepalive_connections=1, keepalive_expiry=60.0)
+
+
 def _close_url_client(client: AsyncClient) -> Awaitable[None]:
     return client.aclose()
 
@@ -58,7 +65,7 @@ class UrlHealthCheck(ClientCachingMixin["AsyncClient"], ConfigDictMixin, HealthC
 
     @property
     def _transport(self) -> AsyncHTTPTransport:
-        return AsyncHTTPTransport(verify=self._config.verify_ssl)
+        return AsyncHTTPTransport(verify=self._config.verify_ssl, limits=_KEEPALIVE_LIMITS)
 
     @property
     def _block_private_hosts(self) -> bool:
@@ -96,11 +103,10 @@ class UrlHealthCheck(ClientCachingMixin["AsyncClient"], ConfigDictMixin, HealthC
 
     def _create_client(self) -> AsyncClient:
         c = self._config
-        transport = AsyncHTTPTransport(verify=c.verify_ssl)
         return AsyncClient(
             auth=self._auth,
             timeout=c.timeout,
-            transport=transport,
+            transport=self._transport,
             follow_redirects=c.follow_redirects,
         )
 
@@ -8,11 +8,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import json
 import logging
 import re
+import time
+import weakref
 from collections.abc import Awaitable, Callable, Iterable, Sequence
-from dataclasses import asdict
 from http import HTTPStatus
 from typing import Any, NamedTuple, TypeAlias, TypeVar
 
@@ -40,6 +42,9 @@ class ProbeRouteParams(NamedTuple):
     failure_status: int
     debug: bool
     timeout: float | None
+    cache_ttl: float | None = None
+    background_interval: float | None = None
+    check_timeout: float | None = None
 
     def to_options(self, prefix: str = "/health") -> ProbeRouteOptions:
         """Return ProbeRouteOptions with the given prefix."""
@@ -51,6 +56,9 @@ class ProbeRouteParams(NamedTuple):
             debug=self.debug,
             timeout=self.timeout,
             prefix=prefix,
+            cache_ttl=self.cache_ttl,
+            background_interval=self.background_interval,
+            check_timeout=self.check_timeout,
         )
 
 
@@ -64,6 +72,9 @@ class ProbeRouteOptions(NamedTuple):
     debug: bool
     timeout: float | None
     prefix: str
+    cache_ttl: float | None = None
+    background_interval: float | None = None
+    check_timeout: float | None = None
 
     def to_route_params(self) -> ProbeRouteParams:
         """Return ProbeRouteParams for create_probe_route_handler."""
@@ -74,6 +85,9 @@ class ProbeRouteOptions(NamedTuple):
             failure_status=self.failure_status,
             debug=self.debug,
             timeout=self.timeout,
+            cache_ttl=self.cache_ttl,
+            background_interval=self.background_interval,
+            check_timeout=self.check_timeout,
         )
 
 
@@ -137,6 +151,11 @@ async def default_handler(response: ProbeAsgiResponse) -> dict[str, Any] | None:
     return {"status": "healthy" if response.healthy else "unhealthy"}
 
 
+@functools.lru_cache(maxsize=64)
+def _shared_probe_route_options(options: ProbeRouteOptions) -> ProbeRouteOptions:
+    return options
+
+
 def build_probe_route_options(  # noqa: PLR0913
     *,
     success_handler: HandlerType = default_handler,
@@ -146,9 +165,16 @@ def build_probe_route_options(  # noqa: PLR0913
     debug: bool = False,
     prefix: str = "/health",
     timeout: float | None = None,
+    cache_ttl: float | None = None,
+    background_interval: float | None = None,
+    check_timeout: float | None = None,
 ) -> ProbeRouteOptions:
     """Build ProbeRouteOptions with defaults. Used by health() and _add_probe_route.
 
+    Options are immutable, so calls with the same arguments return the same
+    cached instance. Unhashable handlers (e.g. callable dataclass instances)
+    bypass the cache and get a fresh instance.
+
     Args:
         success_handler: Handler for healthy responses. Receives ProbeAsgiResponse.
         failure_handler: Handler for unhealthy responses. Same signature.
@@ -157,11 +183,29 @@ def build_probe_route_options(  # noqa: PLR0913
         debug: Include check details in responses.
         prefix: URL prefix for probe routes (e.g. "/health").
         timeout: Max seconds for all checks; on exceed returns failure. None = no limit.
+        cache_ttl: Seconds to reuse the last report for repeated requests to the same
+            route. Concurrent requests share a single in-flight probe run. None = no caching.
+        background_interval: Seconds between background probe runs. When set, checks run
+            in a task started on the first request and requests return the latest report;
+            the task is stopped by close_probes() / healthcheck_shutdown(). None = disabled.
+        check_timeout: Max seconds for each check; a check that exceeds it fails on its own
+            while the other checks keep their results. None = no per-check limit.
 
     Returns:
         ProbeRouteOptions for use with HealthcheckRouter or health().
+
+    Raises:
+        ValueError: When cache_ttl, background_interval, or check_timeout is not positive.
     """
-    return ProbeRouteOptions(
+    for option, value in (
+        ("cache_ttl", cache_ttl),
+        ("background_interval", background_interval),
+        ("check_timeout", check_timeout),
+    ):
+        if value is not None and value <= 0:
+            msg = f"{option} must be positive, got {value!r}"
+            raise ValueError(msg)
+    options = ProbeRouteOptions(
         success_handler=success_handler,
         failure_handler=failure_handler,
         success_status=success_status,
@@ -169,18 +213,41 @@ def build_probe_route_options(  # noqa: PLR0913
         debug=debug,
         timeout=timeout,
         prefix=prefix,
+        cache_ttl=cache_ttl,
+        background_interval=background_interval,
+        check_timeout=check_timeout,
     )
+    try:
+        return _shared_probe_route_options(options)
+    except TypeError:
+        return options
 
 
 def _get_check_name(check: Check, index: int) -> str:
     return getattr(check, "name", None) or getattr(check, "_name", f"Check-{index}")
 
 
-async def _run_check_safe(check: Check, index: int) -> HealthCheckResult:
+async def _await_check(check: Check, name: str, timeout: float | None) -> HealthCheckResult:
+    """Await the check, bounded by ``timeout`` when set.
+
+    Returns:
+        The check's result, or a failed result with "Check timed out" when ``timeout`` is exceeded.
+    """
+    if timeout is None:
+        return await check()
+    try:
+        return await asyncio.wait_for(check(), timeout=timeout)
+    except asyncio.TimeoutError:
+        return HealthCheckResult(name=name, healthy=False, error_details="Check timed out")
+
+
+async def _run_check_safe(check: Check, index: int, timeout: float | None = None) -> HealthCheckResult:
     """Run a single check; wrap failures in HealthCheckResult.
 
     CancelledError, SystemExit, and KeyboardInterrupt are re-raised and never
-    wrapped. All other exceptions produce a failed HealthCheckResult.
+    wrapped. All other exceptions produce a failed HealthCheckResult. When
+    ``timeout`` is exceeded, the check is cancelled and a failed result with
+    ``error_details="Check timed out"`` is returned.
 
     Returns:
         HealthCheckResult from the check, or a failed result on exception.
@@ -193,7 +260,7 @@ async def _run_check_safe(check: Check, index: int) -> HealthCheckResult:
     name = _get_check_name(check, index)
     get_probe_logger().log(logging.DEBUG, "check_start", check_name=name, index=index)
     try:
-        result = await check()
+        result = await _await_check(check, name, timeout)
         get_probe_logger().log(
             logging.DEBUG,
             "check_end",
@@ -220,14 +287,20 @@ async def _gather_check_results(
     probe: Probe,
     timeout: float | None = None,
     *,
+    check_timeout: float | None = None,
     on_timeout_return_failure: bool = False,
 ) -> list[HealthCheckResult]:
     """Run all probe checks in parallel, optionally with timeout.
 
+    A check instance listed more than once in ``probe.checks`` runs once and its
+    result is reported at every position.
+
     Args:
         probe: The probe whose checks to run.
         timeout: Max seconds. When exceeded, raises HealthCheckTimeoutError unless
             on_timeout_return_failure is True.
+        check_timeout: Max seconds for each check. A check that exceeds it gets a
+            failed result; the others are not affected.
         on_timeout_return_failure: If True, return failure results instead of raising.
 
     Returns:
@@ -236,12 +309,15 @@ async def _gather_check_results(
     Raises:
         HealthCheckTimeoutError: When timeout is exceeded and on_timeout_return_failure is False.
     """
-    tasks = [_run_check_safe(check, i) for i, check in enumerate(probe.checks)]
+    positions: dict[int, int] = {}
+    tasks: list[Awaitable[HealthCheckResult]] = []
+    for i, check in enumerate(probe.checks):
+        if id(check) not in positions:
+            positions[id(check)] = len(tasks)
+            tasks.append(_run_check_safe(check, i, check_timeout))
     if timeout is not None:
         try:
-            return list(
-                await asyncio.wait_for(asyncio.gather(*tasks), timeout=timeout),
-            )
+            results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=timeout)
         except asyncio.TimeoutError:
             if on_timeout_return_failure:
                 return [
@@ -253,7 +329,51 @@ async def _gather_check_results(
                     for i, check in enumerate(probe.checks)
                 ]
             raise HealthCheckTimeoutError from None
-    return list(await asyncio.gather(*tasks))
+    else:
+        results = await asyncio.gather(*tasks)
+    return [results[positions[id(check)]] for check in probe.checks]
+
+
+def _report_to_dict(report: HealthCheckReport, *, debug: bool) -> dict[str, Any]:
+    """Return the response payload for a report.
+
+    Built field by field instead of via ``dataclasses.asdict``, which recurses
+    and deep-copies every value. Without ``debug``, ``error_details`` and
+    ``allow_partial_failure`` are left out.
+
+    Returns:
+        Dict with ``results`` (and ``allow_partial_failure`` when debug is True).
+    """
+    if not debug:
+        return {"results": [{"name": result.name, "healthy": result.healthy} for result in report.results]}
+    return {
+        "results": [
+            {"name": result.name, "healthy": result.healthy, "error_details": result.error_details}
+            for result in report.results
+        ],
+        "allow_partial_failure": report.allow_partial_failure,
+    }
+
+
+def _content_needed(status: int, *, healthy: bool) -> bool:
+    """Return whether a response with this status carries a body.
+
+    Returns:
+        False for 204/304 and for healthy 1xx statuses, True otherwise.
+    """
+    return status not in {HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED} and not (healthy and status < HTTPStatus.OK)
+
+
+def _copy_response(
+    response: tuple[bytes, dict[str, str] | None, int],
+) -> tuple[bytes, dict[str, str] | None, int]:
+    """Return a cached response with its own headers dict, so callers cannot mutate the cache.
+
+    Returns:
+        The same body and status with a copied headers dict.
+    """
+    content, headers, status = response
+    return content, dict(headers) if headers is not None else None, status
 
 
 class ProbeAsgi:
@@ -261,18 +381,37 @@ class ProbeAsgi:
 
     Args:
         probe: The probe to run.
-        options: Route options (handlers, status codes, debug, timeout).
-            When None, defaults from build_probe_route_options() are used.
+        options: Route options (handlers, status codes, debug, timeout, cache_ttl,
+            background_interval). When None, defaults from build_probe_route_options() are used.
+
+    When ``cache_ttl`` is set, the last report is reused until ``cache_ttl``
+    seconds after the run that produced it completed, and concurrent callers
+    await a single in-flight run instead of starting their own.
+
+    When ``background_interval`` is set, the first call starts a task that
+    re-runs the probe every ``background_interval`` seconds; calls then return
+    the latest report without waiting for checks.
     """
 
     __slots__ = (
+        "__weakref__",
+        "_background_interval",
+        "_cache_ttl",
+        "_cached_report",
+        "_cached_until",
+        "_check_timeout",
         "_debug",
-        "_exclude_fields",
         "_failure_handler",
         "_failure_status",
+        "_inflight",
+        "_map_content_needed",
         "_map_handler",
         "_map_status",
+        "_poller",
         "_probe",
+        "_render_once",
+        "_rendered",
+        "_reusable",
         "_success_handler",
         "_success_status",
         "_timeout",
@@ -284,10 +423,20 @@ class ProbeAsgi:
     _success_status: int
     _failure_status: int
     _debug: bool
-    _exclude_fields: set[str]
     _map_status: dict[bool, int]
     _map_handler: dict[bool, HandlerType]
+    _map_content_needed: dict[bool, bool]
     _timeout: float | None
+    _check_timeout: float | None
+    _cache_ttl: float | None
+    _cached_report: HealthCheckReport | None
+    _cached_until: float
+    _inflight: asyncio.Task[HealthCheckReport] | None
+    _background_interval: float | None
+    _poller: asyncio.Task[None] | None
+    _rendered: tuple[HealthCheckReport, tuple[bytes, dict[str, str] | None, int]] | None
+    _render_once: bool
+    _reusable: dict[bool, bool]
 
     def __init__(self, probe: Probe, *, options: ProbeRouteOptions | None = None) -> None:
         """Initialize the ASGI probe."""
@@ -301,58 +450,160 @@ class ProbeAsgi:
         self._failure_status = params.failure_status
         self._debug = params.debug
         self._timeout = params.timeout
-        self._exclude_fields = {"allow_partial_failure", "error_details"} if not params.debug else set()
+        self._check_timeout = params.check_timeout
+        self._cache_ttl = params.cache_ttl
+        self._cached_report = None
+        self._cached_until = 0.0
+        self._inflight = None
+        self._background_interval = params.background_interval
+        self._poller = None
+        self._rendered = None
         self._map_status = {True: params.success_status, False: params.failure_status}
         self._map_handler = {True: params.success_handler, False: params.failure_handler}
+        self._map_content_needed = {
+            True: _content_needed(params.success_status, healthy=True),
+            False: _content_needed(params.failure_status, healthy=False),
+        }
+        # A response can be reused only when no custom handler builds it: custom handlers run on every request.
+        self._reusable = {
+            True: not self._map_content_needed[True] or params.success_handler is default_handler,
+            False: not self._map_content_needed[False] or params.debug or params.failure_handler is default_handler,
+        }
+        # A probe without checks is always healthy, so a reusable response for it never changes.
+        self._render_once = not probe.checks and self._reusable[True]
+
+    async def _run_and_cache(self) -> HealthCheckReport:
+        try:
+            report = await run_probe(
+                self._probe,
+                timeout=self._timeout,
+                check_timeout=self._check_timeout,
+                on_timeout_return_failure=True,
+            )
+            # Expiry counts from completion so slow probes are not re-run back to back.
+            self._cached_report = report
+            self._cached_until = time.monotonic() + (self._cache_ttl or 0.0)
+            return report
+        finally:
+            self._inflight = None
+
+    async def _poll(self, interval: float) -> None:
+        while True:
+            inflight = self._inflight
+            if inflight is None:
+                inflight = asyncio.ensure_future(self._run_and_cache())
+                self._inflight = inflight
+            # Shield so stop_polling() does not cancel a run that requests may be awaiting.
+            await asyncio.shield(inflight)
+            await asyncio.sleep(interval)
+
+    def _ensure_poller(self, interval: float) -> None:
+        poller = self._poller
+        if poller is not None and not poller.done() and poller.get_loop() is asyncio.get_running_loop():
+            return
+        self._poller = asyncio.ensure_future(self._poll(interval))
+        _POLLING_PROBES.add(self)
+
+    async def stop_polling(self) -> None:
+        """Cancel the background polling task, if running.
+
+        A probe run already in flight is not cancelled: requests may be awaiting
+        it, so this waits for it to finish before returning.
+        """
+        _POLLING_PROBES.discard(self)
+        poller, self._poller = self._poller, None
+        if poller is None or poller.done():
+            return
+        poller.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await poller
+        inflight = self._inflight
+        if inflight is not None:
+            await asyncio.wait((inflight,))
+
+    async def _get_report(self) -> HealthCheckReport:
+        """Return a fresh or cached report, sharing one in-flight run between callers."""
+        if self._background_interval is not None:
+            self._ensure_poller(self._background_interval)
+            if self._cached_report is not None:
+                return self._cached_report
+        elif self._cache_ttl is None:
+            return await run_probe(
+                self._probe,
+                timeout=self._timeout,
+                check_timeout=self._check_timeout,
+                on_timeout_return_failure=True,
+            )
+        elif self._cached_report is not None and time.monotonic() < self._cached_until:
+            return self._cached_report
+        inflight = self._inflight
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._run_and_cache())
+            self._inflight = inflight
+        # Shield so one cancelled request does not cancel the run other requests await.
+        return await asyncio.shield(inflight)
 
     async def __call__(self) -> tuple[bytes, dict[str, str] | None, int]:
         """Run the probe via run_probe (unified execution and timeout handling).
 
+        With ``cache_ttl`` or ``background_interval``, the encoded response for a
+        cached report is kept and returned as-is while that report is served. A
+        probe without checks always yields the same report, so its response is
+        rendered once and returned without running the probe again. Both
+        shortcuts apply only when the default handler (or a status without
+        content) produces the response; custom handlers are called on every
+        request.
+
         Returns:
             A tuple containing the response body, headers, and status code.
         """
-        report = await run_probe(
-            self._probe,
-            timeout=self._timeout,
-            on_timeout_return_failure=True,
-        )
+        rendered = self._rendered
+        if rendered is not None and self._render_once:
+            return _copy_response(rendered[1])
+        report = await self._get_report()
+        if rendered is not None and rendered[0] is report:
+            return _copy_response(rendered[1])
+        response = await self._render(report)
+        if self._reusable[report.healthy] and (
+            self._render_once or self._cache_ttl is not None or self._background_interval is not None
+        ):
+            # The report is reused across requests, so reuse its encoded body too.
+            self._rendered = (report, response)
+            return _copy_response(response)
+        return response
+
+    async def _render(self, report: HealthCheckReport) -> tuple[bytes, dict[str, str] | None, int]:
+        healthy = report.healthy
+        status = self._map_status[healthy]
+        if not self._map_content_needed[healthy]:
+            return b"", None, status
+
         response = ProbeAsgiResponse(
-            data=asdict(
-                report,
-                dict_factory=lambda x: {k: v for (k, v) in x if k not in self._exclude_fields},
-            ),
-            healthy=report.healthy,
+            data=_report_to_dict(report, debug=self._debug),
+            healthy=healthy,
         )
-
-        actual_status = self._map_status[response.healthy]
-        content_needed = actual_status not in {
-            HTTPStatus.NO_CONTENT,
-            HTTPStatus.NOT_MODIFIED,
-        } and not (response.healthy and actual_status < HTTPStatus.OK)
-
-        content = b""
-        headers = None
-        if content_needed:
-            # When debug=True and unhealthy, return full report so assertion/logs show which check failed
-            if self._debug and not response.healthy:
-                content_ = response.data
-            else:
-                handler = self._map_handler[response.healthy]
-                content_ = await handler(response)
-            if content_ is not None:
-                content = json.dumps(
-                    content_,
-                    ensure_ascii=False,
-                    allow_nan=False,
-                    indent=None,
-                    separators=(",", ":"),
-                ).encode("utf-8")
-                headers = {
-                    "content-type": "application/json",
-                    "content-length": str(len(content)),
-                }
-
-        return content, headers, self._map_status[response.healthy]
+        # When debug=True and unhealthy, return full report so assertion/logs show which check failed
+        if self._debug and not healthy:
+            content_ = response.data
+        else:
+            content_ = await self._map_handler[healthy](response)
+        if content_ is None:
+            return b"", None, status
+        content = json.dumps(
+            content_,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        headers = {
+            "content-type": "application/json",
+            "content-length": str(len(content)),
+        }
+        return content, headers, status
+
+
+_POLLING_PROBES: weakref.WeakSet[ProbeAsgi] = weakref.WeakSet()
 
 
 def make_probe_asgi(
@@ -451,10 +702,11 @@ def create_probe_route_handler(
     return handler
 
 
-async def run_probe(
+async def run_probe(  # noqa: PLR0913
     probe: Probe,
     *,
     timeout: float | None = None,
+    check_timeout: float | None = None,
     on_check_start: OnCheckStart | None = None,
     on_check_end: OnCheckEnd | None = None,
     on_timeout_return_failure: bool = False,
@@ -465,7 +717,10 @@ async def run_probe(
     on_timeout_return_failure=True so timeout behavior is unified.
 
     When ``on_check_start`` or ``on_check_end`` are provided, checks run
-    sequentially (for ordering guarantees). Otherwise they run in parallel.
+    sequentially (for ordering guarantees). Otherwise they run in parallel via
+    ``asyncio.gather``, so wall time is bounded by the slowest check rather than
+    the sum of all checks; results keep the order of ``probe.checks``. A check
+    instance listed more than once runs once per probe run.
 
     **Cleanup and cancellation:** On cancellation or timeout, run_probe does not
     close cached clients (checks with ``aclose``). The caller must call
@@ -479,10 +734,15 @@ async def run_probe(
     return HealthCheckReport with failed results for timed-out checks.
     ProbeAsgi uses Mode B. See docs run-probe.md for full semantics.
 
+    **Per-check timeout:** When ``check_timeout`` is set, each check is bounded
+    on its own; a check that exceeds it gets a failed result with
+    ``error_details="Check timed out"`` and does not affect the other results.
+
     Args:
         probe: The probe to run.
         timeout: Maximum seconds for all checks. Raises asyncio.TimeoutError if exceeded
             unless on_timeout_return_failure is True.
+        check_timeout: Maximum seconds for each check. None = no per-check limit.
         on_check_start: Optional callback before each check runs. Receives (check, index).
         on_check_end: Optional callback after each check completes. Receives (check, index, result).
         on_timeout_return_failure: If True, on timeout return a report with failed results
@@ -506,16 +766,21 @@ async def run_probe(
             results = await _gather_check_results(
                 probe,
                 timeout=timeout,
+                check_timeout=check_timeout,
                 on_timeout_return_failure=on_timeout_return_failure,
             )
         else:
 
             async def _run_with_hooks() -> list[HealthCheckResult]:
                 out: list[HealthCheckResult] = []
+                seen: dict[int, HealthCheckResult] = {}
                 for i, check in enumerate(probe.checks):
                     if on_check_start is not None:
                         await on_check_start(check, i)
-                    result = await _run_check_safe(check, i)
+                    result = seen.get(id(check))
+                    if result is None:
+                        result = await _run_check_safe(check, i, check_timeout)
+                        seen[id(check)] = result
                     if on_check_end is not None:
                         await on_check_end(check, i, result)
                     out.append(result)
@@ -560,8 +825,11 @@ async def run_probe(
 async def close_probes(probes: Iterable[Probe]) -> None:
     """Close resources owned by checks in the given probes.
 
-    Calls ``aclose()`` on each check that has it (e.g. checks with cached
-    clients). Ignores exceptions so one failure does not block others.
+    Stops background polling started for these probes (``background_interval``
+    route option), then calls ``aclose()`` on each check that has it (e.g.
+    checks with cached clients). Checks are closed concurrently, each check
+    instance once even if several probes share it. Ignores exceptions so one
+    failure does not block others.
     After closing, yields to the event loop a few times so that any
     transport/socket cleanup callbacks (e.g. from aiohttp connector) can run
     before the caller's context is torn down (avoids unclosed-resource
@@ -570,12 +838,20 @@ async def close_probes(probes: Iterable[Probe]) -> None:
     Args:
         probes: Probes whose checks should be closed.
     """
+    probes = list(probes)
+    for probe_asgi in list(_POLLING_PROBES):
+        if any(probe_asgi._probe is probe for probe in probes):  # noqa: SLF001
+            await probe_asgi.stop_polling()
+    closers: dict[int, Callable[[], Awaitable[None]]] = {}
     for probe in probes:
         for check in probe.checks:
             aclose = getattr(check, "aclose", None)
             if callable(aclose):
-                with contextlib.suppress(Exception):
-                    await aclose()
+                closers.setdefault(id(check), aclose)
+    results = await asyncio.gather(*(aclose() for aclose in closers.values()), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
     # aiohttp (opensearch-py) schedules transport cleanup on the next loop
     # iteration; yield so it can run before the caller tears down.
     await asyncio.sleep(0)
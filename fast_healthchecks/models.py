@@ -40,7 +40,7 @@ class HealthCheckSSRFError(HealthCheckError, ValueError):
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HealthCheckResult:
     """Result of a healthcheck.
 
@@ -59,7 +59,7 @@ class HealthCheckResult:
         return f"{self.name}: {'healthy' if self.healthy else 'unhealthy'}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HealthCheckReport:
     """Report of healthchecks.
 
@@ -1,5 +1,6 @@
 """Integration tests for PostgreSQLAsyncPGHealthCheck against real PostgreSQL."""
 
+import asyncio
 import ssl
 
 import pytest
@@ -53,8 +54,11 @@ async def test_postgresql_asyncpg_check_success(asyncpg_config: AsyncPGConfig) -
         ssl=asyncpg_config["ssl"],
         direct_tls=asyncpg_config["direct_tls"],
     )
-    result = await check()
-    assert result == HealthCheckResult(name="PostgreSQL", healthy=True, error_details=None)
+    try:
+        result = await check()
+        assert result == HealthCheckResult(name="PostgreSQL", healthy=True, error_details=None)
+    finally:
+        await check.aclose()
 
 
 @pytest.mark.asyncio
@@ -69,9 +73,12 @@ async def test_postgresql_asyncpg_check_failure(asyncpg_config: AsyncPGConfig) -
         ssl=asyncpg_config["ssl"],
         direct_tls=asyncpg_config["direct_tls"],
     )
-    result = await check()
-    assert result.healthy is False
-    assert_error_contains_any(result.error_details, DNS_ERROR_FRAGMENTS)
+    try:
+        result = await check()
+        assert result.healthy is False
+        assert_error_contains_any(result.error_details, DNS_ERROR_FRAGMENTS)
+    finally:
+        await check.aclose()
 
 
 @pytest.mark.asyncio
@@ -86,6 +93,28 @@ async def test_postgresql_asyncpg_check_connection_error(asyncpg_config: AsyncPG
         ssl=asyncpg_config["ssl"],
         direct_tls=asyncpg_config["direct_tls"],
     )
-    result = await check()
-    assert result.healthy is False
-    assert_error_contains_any(result.error_details, CONNECTION_REFUSED_FRAGMENTS)
+    try:
+        result = await check()
+        assert result.healthy is False
+        assert_error_contains_any(result.error_details, CONNECTION_REFUSED_FRAGMENTS)
+    finally:
+        await check.aclose()
+
+
+@pytest.mark.asyncio
+async def test_postgresql_asyncpg_check_concurrent_calls(asyncpg_config: AsyncPGConfig) -> None:
+    """Overlapping calls on one instance share the cached connection and all succeed."""
+    check = PostgreSQLAsyncPGHealthCheck(
+        host=asyncpg_config["host"],
+        port=asyncpg_config["port"],
+        user=asyncpg_config["user"],
+        password=asyncpg_config["password"],
+        database=asyncpg_config["database"],
+        ssl=asyncpg_config["ssl"],
+        direct_tls=asyncpg_config["direct_tls"],
+    )
+    try:
+        results = await asyncio.gather(*(check() for _ in range(5)))
+        assert all(result.healthy for result in results)
+    finally:
+        await check.aclose()
@@ -1,5 +1,6 @@
 """Unit tests for PostgreSQLAsyncPGHealthCheck."""
 
+import asyncio
 import ssl
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -783,12 +784,30 @@ async def test_asyncpg_connect_args_kwargs() -> None:
                 ssl=test_ssl_context,
                 direct_tls=True,
             )
-            Connection_mock.transaction.assert_called_once_with(readonly=True)
-            Connection_mock.fetchval.assert_called_once_with("SELECT 1")
-            Connection_mock.fetchval.assert_awaited_once_with("SELECT 1")
+            Connection_mock.transaction.assert_not_called()
+            Connection_mock.fetchval.assert_called_once_with("SELECT 1", timeout=1.5)
+            Connection_mock.fetchval.assert_awaited_once_with("SELECT 1", timeout=1.5)
             Connection_mock.is_closed.assert_called_once_with()
-            Connection_mock.close.assert_called_once_with(timeout=1.5)
-            Connection_mock.close.assert_awaited_once_with(timeout=1.5)
+            Connection_mock.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ssl_factory_called_once() -> None:
+    """A callable ssl config is called on the first run only and its context is passed to connect."""
+    ssl_context = ssl.create_default_context()
+    ssl_factory = MagicMock(return_value=ssl_context)
+    health_check = PostgreSQLAsyncPGHealthCheck(host="localhost2", ssl=ssl_factory)
+    ssl_factory.assert_not_called()
+    Connection_mock = MagicMock(spec=Connection)
+    Connection_mock.is_closed.return_value = False
+    with patch(
+        "fast_healthchecks.checks.postgresql.asyncpg.asyncpg.connect",
+        return_value=Connection_mock,
+    ) as asyncpg_connect_mock:
+        await health_check()
+        await health_check()
+    ssl_factory.assert_called_once_with()
+    assert all(call.kwargs["ssl"] is ssl_context for call in asyncpg_connect_mock.call_args_list)
 
 
 @pytest.mark.asyncio
@@ -832,10 +851,10 @@ async def test__call_success() -> None:
                 ssl=test_ssl_context,
                 direct_tls=True,
             )
-            Connection_mock.transaction.assert_called_once_with(readonly=True)
-            Connection_mock.fetchval.assert_called_once_with("SELECT 1")
+            Connection_mock.transaction.assert_not_called()
+            Connection_mock.fetchval.assert_called_once_with("SELECT 1", timeout=1.5)
             Connection_mock.is_closed.assert_called_once_with()
-            Connection_mock.close.assert_called_once_with(timeout=1.5)
+            Connection_mock.close.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -880,7 +899,114 @@ async def test__call_failure() -> None:
                 ssl=test_ssl_context,
                 direct_tls=True,
             )
-            Connection_mock.transaction.assert_called_once_with(readonly=True)
-            Connection_mock.fetchval.assert_called_once_with("SELECT 1")
-            Connection_mock.is_closed.assert_called_once_with()
-            Connection_mock.close.assert_called_once_with(timeout=1.5)
+            Connection_mock.transaction.assert_not_called()
+            Connection_mock.fetchval.assert_called_once_with("SELECT 1", timeout=1.5)
+            assert Connection_mock.is_closed.call_count == 2  # noqa: PLR2004
+            Connection_mock.close.assert_awaited_once_with(timeout=1.5)
+            assert health_check._client is None
+
+
+@pytest.mark.asyncio
+async def test_connection_reused_between_calls() -> None:
+    """The connection is opened once and kept open between calls."""
+    health_check = PostgreSQLAsyncPGHealthCheck(host="localhost2")
+    Connection_mock = MagicMock(spec=Connection)
+    Connection_mock.is_closed.return_value = False
+    Connection_mock.fetchval.return_value = 1
+    with patch(
+        "fast_healthchecks.checks.postgresql.asyncpg.asyncpg.connect",
+        return_value=Connection_mock,
+    ) as asyncpg_connect_mock:
+        assert (await health_check()).healthy is True
+        assert (await health_check()).healthy is True
+    asyncpg_connect_mock.assert_awaited_once()
+    Connection_mock.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_closed_connection_is_replaced() -> None:
+    """A cached connection closed by the server is replaced before the query runs."""
+    health_check = PostgreSQLAsyncPGHealthCheck(host="localhost2")
+    first = MagicMock(spec=Connection)
+    first.is_closed.return_value = False
+    first.fetchval.return_value = 1
+    second = MagicMock(spec=Connection)
+    second.is_closed.return_value = False
+    second.fetchval.return_value = 1
+    with patch(
+        "fast_healthchecks.checks.postgresql.asyncpg.asyncpg.connect",
+        side_effect=[first, second],
+    ) as asyncpg_connect_mock:
+        await health_check()
+        first.is_closed.return_value = True
+        result = await health_check()
+    assert result.healthy is True
+    assert asyncpg_connect_mock.await_count == 2  # noqa: PLR2004
+    first.close.assert_not_called()
+    second.fetchval.assert_awaited_once_with("SELECT 1", timeout=5.0)
+    assert health_check._client is second
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_connection() -> None:
+    """aclose() closes and clears the cached connection."""
+    health_check = PostgreSQLAsyncPGHealthCheck(host="localhost2")
+    Connection_mock = MagicMock(spec=Connection)
+    Connection_mock.is_closed.return_value = False
+    with patch("fast_healthchecks.checks.postgresql.asyncpg.asyncpg.connect", return_value=Connection_mock):
+        await health_check()
+        await health_check.aclose()
+    Connection_mock.close.assert_awaited_once_with(timeout=5.0)
+    assert health_check._client is None
+    assert health_check._client_loop is None
+
+
+@pytest.mark.asyncio
+async def test_overlapping_calls_run_one_query_at_a_time() -> None:
+    """Overlapping calls on one instance do not run two queries on the shared connection."""
+    health_check = PostgreSQLAsyncPGHealthCheck(host="localhost2")
+    in_progress = False
+
+    async def fetchval(*_: object, **__: object) -> int:
+        nonlocal in_progress
+        if in_progress:
+            msg = "another operation is in progress"
+            raise RuntimeError(msg)
+        in_progress = True
+        await asyncio.sleep(0.01)
+        in_progress = False
+        return 1
+
+    Connection_mock = MagicMock(spec=Connection)
+    Connection_mock.is_closed.return_value = False
+    Connection_mock.fetchval.side_effect = fetchval
+    with patch(
+        "fast_healthchecks.checks.postgresql.asyncpg.asyncpg.connect",
+        return_value=Connection_mock,
+    ) as asyncpg_connect_mock:
+        results = await asyncio.gather(*(health_check() for _ in range(3)))
+    assert all(result.healthy for result in results)
+    asyncpg_connect_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_waiting_call_reconnects_after_failure() -> None:
+    """A call waiting behind a failed query runs on a new connection, not the closed one."""
+    health_check = PostgreSQLAsyncPGHealthCheck(host="localhost2", timeout=1.5)
+    first = MagicMock(spec=Connection)
+    first.is_closed.return_value = False
+    first.fetchval.side_effect = Exception("Database error")
+    second = MagicMock(spec=Connection)
+    second.is_closed.return_value = False
+    second.fetchval.return_value = 1
+    with patch(
+        "fast_healthchecks.checks.postgresql.asyncpg.asyncpg.connect",
+        side_effect=[first, second],
+    ):
+        failed, healthy = await asyncio.gather(health_check(), health_check())
+    assert failed.healthy is False
+    assert "Database error" in str(failed.error_details)
+    assert healthy.healthy is True
+    first.close.assert_awaited_once_with(timeout=1.5)
+    first.fetchval.assert_awaited_once()
+    second.fetchval.assert_awaited_once_with("SELECT 1", timeout=1.5)
@@ -114,3 +114,20 @@ def test_create_ssl_context_cache_returns_same_context() -> None:
     ctx1 = create_ssl_context("require", None, None, None)
     ctx2 = create_ssl_context("require", None, None, None)
     assert ctx1 is ctx2
+
+
+def test_parse_dsn_reuses_parsed_dsn() -> None:
+    """parse_dsn reuses the split DSN but returns a new dict on each call."""
+    dsn = "postgresql://localhost/db?sslmode=require"
+    first = BasePostgreSQLHealthCheck.parse_dsn(dsn)
+    second = BasePostgreSQLHealthCheck.parse_dsn(dsn)
+    assert second is not first
+    assert second["parse_result"] is first["parse_result"]
+
+
+def test_parse_dsn_honors_ssl_context_cache_clear() -> None:
+    """Clearing the SSL context cache gives a new context for an already parsed DSN."""
+    dsn = "postgresql://localhost/db?sslmode=require"
+    first = BasePostgreSQLHealthCheck.parse_dsn(dsn)["sslctx"]
+    create_ssl_context.cache_clear()
+    assert BasePostgreSQLHealthCheck.parse_dsn(dsn)["sslctx"] is not first
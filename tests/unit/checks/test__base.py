@@ -67,6 +67,9 @@ class DummyCheck(HealthCheckDSN[HealthCheckResult, object]):
             r"DSN scheme must be one of redis, rediss",
             ValueError,
         ),
+        ("postgresql+bad driver://host/db", ("postgresql",), r"got ''", ValueError),
+        ("1redis://localhost", ("redis",), r"got ''", ValueError),
+        ("redis", ("redis",), r"got ''", ValueError),
         ("", ("redis", "rediss"), "DSN cannot be empty", ValueError),
         ("   ", ("redis", "rediss"), "DSN cannot be empty", ValueError),
         ("\t\n", ("redis",), "DSN cannot be empty", ValueError),
@@ -182,3 +185,35 @@ async def test_healthcheck_safe_exception_returns_result() -> None:
     assert result.healthy is False
     assert result.name == "SafeCheck"
     assert "ValueError" in (result.error_details or "")
+
+
+class _CheckWithInvalidate:
+    """Check-like object that records _invalidate_client calls."""
+
+    _name = "SafeCheck"
+
+    def __init__(self) -> None:
+        """Reset the invalidation counter."""
+        self.invalidations = 0
+
+    async def _invalidate_client(self) -> None:
+        """Count the invalidation."""
+        await asyncio.sleep(0)
+        self.invalidations += 1
+
+
+@pytest.mark.parametrize(("invalidate_on_error", "expected_invalidations"), [(True, 1), (False, 0)])
+@pytest.mark.asyncio
+async def test_healthcheck_safe_invalidate_on_error(*, invalidate_on_error: bool, expected_invalidations: int) -> None:
+    """healthcheck_safe calls _invalidate_client on failure only when invalidate_on_error is True."""
+
+    @healthcheck_safe(invalidate_on_error=invalidate_on_error)
+    async def raises_value_error(self: _CheckWithInvalidate) -> HealthCheckResult:
+        await asyncio.sleep(0)
+        msg = "expected failure"
+        raise ValueError(msg)
+
+    obj = _CheckWithInvalidate()
+    result = await raises_value_error(obj)
+    assert result.healthy is False
+    assert obj.invalidations == expected_invalidations
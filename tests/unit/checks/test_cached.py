@@ -0,0 +1,93 @@
+"""Unit tests for CachedHealthCheck."""
+
+import asyncio
+
+import pytest
+
+from fast_healthchecks.checks.cached import CachedHealthCheck
+from fast_healthchecks.checks.function import FunctionHealthCheck
+from tests.unit.integrations.helpers import CheckWithAclose, CountingCheck
+
+pytestmark = pytest.mark.unit
+
+
+def test_init_uses_wrapped_check_name() -> None:
+    """Name defaults to the wrapped check's name and can be overridden."""
+    inner = FunctionHealthCheck(func=lambda: True, name="Inner")
+    assert CachedHealthCheck(inner, ttl=1.0)._name == "Inner"
+    assert CachedHealthCheck(inner, ttl=1.0, name="Outer")._name == "Outer"
+
+
+def test_init_rejects_negative_ttl() -> None:
+    """Negative ttl raises ValueError."""
+    with pytest.raises(ValueError, match=r"ttl must be non-negative"):
+        CachedHealthCheck(CountingCheck(), ttl=-1.0)
+
+
+@pytest.mark.asyncio
+async def test_call_reuses_result_until_ttl_expires() -> None:
+    """The wrapped check runs again only after ttl has passed."""
+    inner = CountingCheck()
+    check = CachedHealthCheck(inner, ttl=0.05)
+    first = await check()
+    assert await check() is first
+    assert inner.calls == 1
+    await asyncio.sleep(0.1)
+    await check()
+    assert inner.calls == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_call_caches_failed_result() -> None:
+    """Failed results are cached like healthy ones."""
+    inner = CountingCheck(healthy=False)
+    check = CachedHealthCheck(inner, ttl=60.0)
+    assert (await check()).healthy is False
+    assert (await check()).healthy is False
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_run() -> None:
+    """Concurrent callers await a single run of the wrapped check."""
+    inner = CountingCheck(delay=0.05)
+    check = CachedHealthCheck(inner, ttl=60.0)
+    results = await asyncio.gather(*(check() for _ in range(5)))
+    assert inner.calls == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_run() -> None:
+    """Cancelling one caller leaves the run other callers await intact."""
+    inner = CountingCheck(delay=0.05)
+    check = CachedHealthCheck(inner, ttl=60.0)
+    cancelled = asyncio.ensure_future(check())
+    other = asyncio.ensure_future(check())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    result = await other
+    assert result.healthy is True
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_aclose_clears_cache_and_closes_wrapped_check() -> None:
+    """aclose() drops the cached result and closes the wrapped check."""
+    inner = CheckWithAclose(name="A")
+    check = CachedHealthCheck(inner, ttl=60.0)
+    await check()
+    await check.aclose()
+    assert check._result is None
+    inner._aclose_mock.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_aclose_without_wrapped_aclose() -> None:
+    """aclose() works when the wrapped check has no aclose()."""
+    inner = CountingCheck()
+    check = CachedHealthCheck(inner, ttl=60.0)
+    await check()
+    await check.aclose()
+    await check()
+    assert inner.calls == 2  # noqa: PLR2004
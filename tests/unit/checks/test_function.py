@@ -1,6 +1,7 @@
 """Unit tests for FunctionHealthCheck."""
 
 import asyncio
+import threading
 import time
 from typing import Any
 
@@ -114,6 +115,15 @@ def test_init_raises_type_error_when_func_missing_with_config() -> None:
         FunctionHealthCheck(config=config, name="X")
 
 
+def test_to_dict_does_not_deep_copy_args() -> None:
+    """to_dict copies args and kwargs shallowly, so non-copyable arguments are kept as is."""
+    lock = threading.Lock()
+    check = FunctionHealthCheck(func=dummy_sync_function, args=(lock,), kwargs={"lock": lock})
+    data = check.to_dict()
+    assert data["args"][0] is lock
+    assert data["kwargs"]["lock"] is lock
+
+
 @pytest.mark.asyncio
 async def test_sync_function_success() -> None:
     """Sync function check returns healthy."""
@@ -164,3 +174,59 @@ async def test_async_function_returns_false() -> None:
     check = FunctionHealthCheck(func=dummy_async_function_returns_false, timeout=0.2)
     result = await check()
     assert result == HealthCheckResult(name="Function", healthy=False, error_details=None)
+
+
+@pytest.mark.asyncio
+async def test_sync_function_inline_runs_on_event_loop_thread() -> None:
+    """Sync function with run_in_executor=False is called directly on the loop thread."""
+    threads: list[int] = []
+
+    def record_thread() -> bool:
+        threads.append(threading.get_ident())
+        return False
+
+    check = FunctionHealthCheck(func=record_thread, run_in_executor=False)
+    result = await check()
+    assert result == HealthCheckResult(name="Function", healthy=False, error_details=None)
+    assert threads == [threading.get_ident()]
+
+
+@pytest.mark.asyncio
+async def test_sync_function_inline_failure() -> None:
+    """Sync function with run_in_executor=False still captures exceptions."""
+    check = FunctionHealthCheck(
+        func=dummy_sync_function_fail,
+        args=("arg",),
+        kwargs={"kwarg": 2},
+        run_in_executor=False,
+    )
+    result = await check()
+    assert result.healthy is False
+    assert result.error_details is not None
+    assert "Test exception" in result.error_details
+
+
+@pytest.mark.parametrize("run_in_executor", [True, False])
+@pytest.mark.asyncio
+async def test_config_args_passed_on_every_call(*, run_in_executor: bool) -> None:
+    """Args and kwargs from the config reach the function on each call."""
+    calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
+
+    def record_call(*args: object, **kwargs: object) -> bool:
+        calls.append((args, kwargs))
+        return True
+
+    check = FunctionHealthCheck(
+        config=FunctionConfig(args=("arg",), kwargs={"kwarg": 2}),
+        func=record_call,
+        run_in_executor=run_in_executor,
+    )
+    await check()
+    await check()
+    assert calls == [(("arg",), {"kwarg": 2})] * 2
+
+
+def test_function_without_args_is_not_wrapped() -> None:
+    """Without args or kwargs the function is called as is, without a partial."""
+    check = FunctionHealthCheck(func=dummy_sync_function)
+    assert check._bound_func is dummy_sync_function
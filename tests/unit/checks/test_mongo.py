@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import ServerSelectionTimeoutError
 
 from fast_healthchecks.checks.mongo import MongoHealthCheck
 from tests.utils import assert_check_init
@@ -357,6 +358,23 @@ def test_from_dsn(
     assert_check_init(lambda: MongoHealthCheck.from_dsn(*args, **kwargs), expected, exception)
 
 
+@pytest.mark.parametrize(
+    ("dsn", "expected"),
+    [
+        ("mongodb://localhost/test", "admin"),
+        ("mongodb://localhost/test?replicaSet=rs0&retryWrites=true", "admin"),
+        ("mongodb://localhost/test?replicaSet=rs0&authSource=users&w=majority", "users"),
+        ("mongodb://localhost/test?authSource=my%20db", "my db"),
+        ("mongodb://localhost/test?authSource=a&authSource=b", "b"),
+        ("mongodb://localhost/test?xauthSource=x", "admin"),
+        ("mongodb://localhost/test?authSource", ""),
+    ],
+)
+def test_parse_dsn_auth_source(dsn: str, expected: str) -> None:
+    """The authSource value is read from the query string and defaults to admin."""
+    assert MongoHealthCheck.parse_dsn(dsn)["authSource"] == expected
+
+
 @pytest.mark.asyncio
 async def test_AsyncIOMotorClient_args_kwargs() -> None:
     """Constructor args/kwargs are passed through to AsyncIOMotorClient."""
@@ -422,6 +440,27 @@ async def test_AsyncIOMotorClient_reused_between_calls() -> None:
         )
 
 
+@pytest.mark.asyncio
+async def test_database_proxy_reused_until_client_changes() -> None:
+    """The database used for ping is looked up once per cached client."""
+    health_check = MongoHealthCheck(hosts="localhost", port=27017, database="test")
+    db = MagicMock()
+    db.command = AsyncMock(return_value={"ok": 1})
+    first_client = MagicMock()
+    first_client.__getitem__ = MagicMock(return_value=db)
+    first_client.close = AsyncMock()
+    second_client = MagicMock()
+    second_client.__getitem__ = MagicMock(return_value=db)
+    with patch("fast_healthchecks.checks.mongo.AsyncIOMotorClient", side_effect=[first_client, second_client]):
+        await health_check()
+        await health_check()
+        await health_check.aclose()
+        await health_check()
+    first_client.__getitem__.assert_called_once_with("test")
+    second_client.__getitem__.assert_called_once_with("test")
+    assert db.command.await_count == 3  # noqa: PLR2004
+
+
 @pytest.mark.asyncio
 async def test__call_success() -> None:
     """Check returns healthy when ping succeeds."""
@@ -447,6 +486,42 @@ async def test__call_success() -> None:
         mock_client["test"].command.assert_awaited_once_with("ping")
 
 
+@pytest.mark.asyncio
+async def test__call_reuses_healthy_result() -> None:
+    """Successful probes return the same healthy result instance."""
+    health_check = MongoHealthCheck(hosts="localhost", database="test")
+    mock_client = AsyncMock(spec=AsyncIOMotorClient)
+    mock_client["test"].command = AsyncMock(return_value={"ok": 1})
+    with patch("fast_healthchecks.checks.mongo.AsyncIOMotorClient", return_value=mock_client):
+        first = await health_check()
+        assert await health_check() is first
+        assert first.healthy is True
+
+
+@pytest.mark.parametrize(
+    ("response", "healthy"),
+    [
+        ({"ok": 1.0}, True),
+        ({"ok": 1}, True),
+        ({"ok": True}, True),
+        ({"ok": 0.0}, False),
+        ({"ok": "1"}, False),
+        ({}, False),
+    ],
+)
+@pytest.mark.asyncio
+async def test__call_ok_values(response: dict[str, Any], *, healthy: bool) -> None:
+    """Only a numeric ok equal to 1 in the ping response is healthy."""
+    health_check = MongoHealthCheck(hosts="localhost", port=27017, database="test")
+    db = MagicMock()
+    db.command = AsyncMock(return_value=response)
+    mock_client = MagicMock()
+    mock_client.__getitem__ = MagicMock(return_value=db)
+    with patch("fast_healthchecks.checks.mongo.AsyncIOMotorClient", return_value=mock_client):
+        result = await health_check()
+    assert result.healthy is healthy
+
+
 @pytest.mark.asyncio
 async def test__call_failure() -> None:
     """Check returns unhealthy when ping fails."""
@@ -472,9 +547,48 @@ async def test__call_failure() -> None:
         mock_client["test"].command.assert_awaited_once_with("ping")
 
 
+@pytest.mark.asyncio
+async def test__call_timeout() -> None:
+    """Check returns unhealthy when ping outlasts the timeout."""
+    health_check = MongoHealthCheck(hosts="localhost", database="test", timeout=0.01)
+
+    async def hang(*_: object) -> dict[str, Any]:
+        await asyncio.Event().wait()
+        return {"ok": 1}
+
+    mock_client = AsyncMock(spec=AsyncIOMotorClient)
+    mock_client["test"].command = AsyncMock(side_effect=hang)
+    with patch("fast_healthchecks.checks.mongo.AsyncIOMotorClient", return_value=mock_client):
+        result = await health_check()
+        assert result.healthy is False
+        assert result.name == "MongoDB"
+        assert "TimeoutError" in str(result.error_details)
+        assert health_check._client is None
+        assert health_check._ping_target is None
+
+
+@pytest.mark.asyncio
+async def test__call_server_selection_timeout_keeps_driver_error() -> None:
+    """A ServerSelectionTimeoutError raised at the timeout is reported instead of a bare TimeoutError."""
+    health_check = MongoHealthCheck(hosts="localhost", database="test", timeout=0.05)
+
+    async def select_timeout(*_: object) -> dict[str, Any]:
+        await asyncio.sleep(0.05)
+        msg = "localhost:27017: [Errno 111] Connection refused"
+        raise ServerSelectionTimeoutError(msg)
+
+    mock_client = AsyncMock(spec=AsyncIOMotorClient)
+    mock_client["test"].command = AsyncMock(side_effect=select_timeout)
+    with patch("fast_healthchecks.checks.mongo.AsyncIOMotorClient", return_value=mock_client):
+        result = await health_check()
+        assert result.healthy is False
+        assert "ServerSelectionTimeoutError" in str(result.error_details)
+        assert "Connection refused" in str(result.error_details)
+
+
 @pytest.mark.asyncio
 async def test_aclose_clears_client() -> None:
-    """aclose() closes and clears cached client."""
+    """aclose() closes and clears the cached client and its database proxy."""
     health_check = MongoHealthCheck(hosts="localhost", port=27017, auth_source="admin")
     db = MagicMock()
     db.command = AsyncMock(return_value={"ok": 1})
@@ -484,13 +598,31 @@ async def test_aclose_clears_client() -> None:
     with patch("fast_healthchecks.checks.mongo.AsyncIOMotorClient", return_value=mock_client) as factory:
         await health_check()
         assert health_check._client is not None
+        assert health_check._ping_target == (mock_client, db)
         await health_check.aclose()
         assert health_check._client is None
         assert health_check._client_loop is None
+        assert health_check._ping_target is None
         await health_check()
         assert factory.call_count == EXPECTED_CLIENT_CREATIONS_AFTER_RECREATE
 
 
+@pytest.mark.asyncio
+async def test_aclose_with_sync_client_close() -> None:
+    """aclose() works with Motor's synchronous close()."""
+    health_check = MongoHealthCheck(hosts="localhost", port=27017, auth_source="admin")
+    db = MagicMock()
+    db.command = AsyncMock(return_value={"ok": 1})
+    mock_client = MagicMock()
+    mock_client.__getitem__ = MagicMock(return_value=db)
+    mock_client.close = MagicMock(return_value=None)
+    with patch("fast_healthchecks.checks.mongo.AsyncIOMotorClient", return_value=mock_client):
+        await health_check()
+        await health_check.aclose()
+        mock_client.close.assert_called_once_with()
+        assert health_check._client is None
+
+
 @pytest.mark.asyncio
 async def test_aclose_idempotent_when_no_client() -> None:
     """aclose() when no client is safe and idempotent."""
@@ -514,7 +646,7 @@ async def test_loop_invalidation_recreates_client() -> None:
         patch("fast_healthchecks.checks.mongo.AsyncIOMotorClient", return_value=mock_client) as factory,
         patch(
             "fast_healthchecks.checks._base.asyncio.get_running_loop",
-            side_effect=[real_loop, real_loop, other_loop, other_loop],
+            side_effect=[real_loop, other_loop],
         ),
     ):
         await health_check()
@@ -1,7 +1,7 @@
 """Unit tests for RedisHealthCheck."""
 
 import asyncio
-from typing import Any
+from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -350,6 +350,16 @@ def test_from_dsn(
     assert_check_init(lambda: RedisHealthCheck.from_dsn(*args, **kwargs), expected, exception)
 
 
+def test_instance_has_no_dict() -> None:
+    """Base classes declare empty __slots__, so instances carry no __dict__."""
+    assert not hasattr(RedisHealthCheck(), "__dict__")
+
+
+def test_config_has_no_dict() -> None:
+    """RedisConfig is a slotted dataclass, so instances carry no __dict__."""
+    assert not hasattr(RedisHealthCheck()._config, "__dict__")
+
+
 @pytest.mark.asyncio
 async def test_call_success() -> None:
     """Check returns healthy when Redis ping succeeds."""
@@ -403,6 +413,20 @@ async def test_call_reuses_client() -> None:
         )
 
 
+@pytest.mark.asyncio
+async def test_cached_client_returned_without_lock() -> None:
+    """Once cached for the running loop, the client is returned without acquiring the lock."""
+    health_check = RedisHealthCheck(host="localhost")
+    with patch("fast_healthchecks.checks.redis.Redis") as patched_Redis:
+        patched_Redis.return_value.ping = AsyncMock(return_value=True)
+        await health_check()
+        # Any attempt to enter this "lock" fails the check.
+        health_check._ensure_client_lock = cast("asyncio.Lock", object())
+        result = await health_check()
+        assert result.healthy is True
+        patched_Redis.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_call_failure_invalidates_client_then_succeeds() -> None:
     """After check failure with invalidate_on_error, next call creates new client."""
@@ -472,10 +496,13 @@ async def test_aclose_clears_client() -> None:
 
 @pytest.mark.asyncio
 async def test_aclose_idempotent_when_no_client() -> None:
-    """aclose() when no client is safe and idempotent."""
+    """aclose() when no client is safe, idempotent and does not yield to the loop."""
     health_check = RedisHealthCheck(host="localhost", port=6379)
-    await health_check.aclose()
+    with patch("fast_healthchecks.checks._base.asyncio.sleep", new_callable=AsyncMock) as sleep_mock:
+        await health_check.aclose()
+        await health_check.aclose()
     assert health_check._client is None
+    sleep_mock.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -488,7 +515,7 @@ async def test_loop_invalidation_recreates_client() -> None:
         patch("fast_healthchecks.checks.redis.Redis") as patched_redis,
         patch(
             "fast_healthchecks.checks._base.asyncio.get_running_loop",
-            side_effect=[real_loop, real_loop, other_loop, other_loop],
+            side_effect=[real_loop, other_loop],
         ),
     ):
         patched_redis.return_value.ping = AsyncMock(return_value=True)
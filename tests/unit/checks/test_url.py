@@ -246,7 +246,7 @@ async def test_loop_invalidation_recreates_client() -> None:
         patch("fast_healthchecks.checks.url.AsyncClient", return_value=async_client_mock) as factory,
         patch(
             "fast_healthchecks.checks._base.asyncio.get_running_loop",
-            side_effect=[real_loop, real_loop, other_loop, other_loop],
+            side_effect=[real_loop, other_loop],
         ),
     ):
         await health_check()
@@ -295,6 +295,16 @@ def test_url_health_check_block_private_allows_localhost_by_default() -> None:
     assert check._block_private_hosts is False
 
 
+def test_transport_keeps_connection_alive_between_probes() -> None:
+    """Client transport keeps idle connections longer than httpx's 5s default."""
+    health_check = UrlHealthCheck(name="Test", url="https://example.com/")
+    with patch("fast_healthchecks.checks.url.AsyncHTTPTransport") as patched_transport:
+        _ = health_check._transport
+    limits = patched_transport.call_args[1]["limits"]
+    assert limits.max_keepalive_connections == 1
+    assert limits.keepalive_expiry > 5.0  # noqa: PLR2004
+
+
 def test_url_health_check_properties_auth_and_transport() -> None:
     """_auth and _transport properties return expected values."""
     check_with_auth = UrlHealthCheck(
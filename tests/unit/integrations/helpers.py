@@ -1,5 +1,6 @@
 """Shared test helpers for integration unit tests."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 from fast_healthchecks.models import HealthCheckResult
@@ -25,3 +26,32 @@ class CheckWithAclose:
     async def aclose(self) -> None:
         """Call the mock aclose."""
         await self._aclose_mock()
+
+
+class CountingCheck:
+    """Check that counts calls, optionally sleeps, and returns a configurable result."""
+
+    def __init__(self, *, delay: float = 0.0, healthy: bool = True) -> None:
+        """Store delay and result health, reset the call counter."""
+        self._name = "Counting"
+        self._delay = delay
+        self._healthy = healthy
+        self._called = asyncio.Condition()
+        self.calls = 0
+
+    async def __call__(self) -> HealthCheckResult:
+        """Count the call and return the configured result.
+
+        Returns:
+            A result named "Counting" with the configured health.
+        """
+        async with self._called:
+            self.calls += 1
+            self._called.notify_all()
+        await asyncio.sleep(self._delay)
+        return HealthCheckResult(name=self._name, healthy=self._healthy)
+
+    async def wait_for_calls(self, calls: int) -> None:
+        """Wait until the check has been called at least ``calls`` times."""
+        async with self._called:
+            await self._called.wait_for(lambda: self.calls >= calls)
@@ -1,5 +1,7 @@
 """Tests for close_probes and healthcheck_shutdown lifecycle helpers."""
 
+import asyncio
+
 import pytest
 
 from fast_healthchecks.checks.function import FunctionHealthCheck
@@ -40,6 +42,39 @@ async def test_close_probes_ignores_exceptions() -> None:
     check_fail._aclose_mock.assert_awaited_once_with()
 
 
+@pytest.mark.asyncio
+async def test_close_probes_closes_checks_concurrently() -> None:
+    """close_probes awaits all aclose() calls together instead of one after another."""
+    checks = [CheckWithAclose(name=name) for name in "ABCD"]
+    started = 0
+    all_started = asyncio.Event()
+
+    async def blocking_close() -> None:
+        nonlocal started
+        started += 1
+        if started == len(checks):
+            all_started.set()
+        await all_started.wait()
+
+    for check in checks:
+        check._aclose_mock.side_effect = blocking_close
+    # Closing one check after another would block on the first aclose() forever.
+    await asyncio.wait_for(
+        close_probes([Probe(name="p", checks=checks[:2]), Probe(name="q", checks=checks[2:])]),
+        timeout=5.0,
+    )
+    for check in checks:
+        check._aclose_mock.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_close_probes_closes_shared_check_once() -> None:
+    """A check shared by several probes is closed once."""
+    check = CheckWithAclose(name="A")
+    await close_probes([Probe(name="p", checks=[check]), Probe(name="q", checks=[check])])
+    check._aclose_mock.assert_awaited_once_with()
+
+
 @pytest.mark.asyncio
 async def test_close_probes_empty_iterable() -> None:
     """close_probes with no probes does nothing."""
@@ -1,6 +1,10 @@
 """Tests for run_probe function."""
 
 import asyncio
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -8,12 +12,14 @@ from fast_healthchecks.checks.function import FunctionHealthCheck
 from fast_healthchecks.integrations.base import (
     Probe,
     ProbeAsgi,
+    ProbeAsgiResponse,
     build_probe_route_options,
+    close_probes,
     healthcheck_shutdown,
     run_probe,
 )
 from fast_healthchecks.models import HealthCheckReport, HealthCheckResult
-from tests.unit.integrations.helpers import CheckWithAclose
+from tests.unit.integrations.helpers import CheckWithAclose, CountingCheck
 
 pytestmark = pytest.mark.unit
 
@@ -109,6 +115,36 @@ async def test_run_probe_allow_partial_failure() -> None:
     assert report.results[1].healthy is False
 
 
+@pytest.mark.asyncio
+async def test_run_probe_runs_checks_concurrently() -> None:
+    """run_probe without hooks runs checks concurrently and keeps result order."""
+    count = 4
+    started = 0
+    all_started = asyncio.Event()
+
+    async def slow_check() -> bool:
+        """Wait until every check has started, then return True.
+
+        Returns:
+            True.
+        """
+        nonlocal started
+        started += 1
+        if started == count:
+            all_started.set()
+        await all_started.wait()
+        return True
+
+    probe = Probe(
+        name="test",
+        checks=[FunctionHealthCheck(func=slow_check, name=f"Slow {i}") for i in range(count)],
+    )
+    # Sequential execution would block on the first check forever.
+    report = await asyncio.wait_for(run_probe(probe), timeout=5.0)
+    assert report.healthy is True
+    assert [r.name for r in report.results] == [f"Slow {i}" for i in range(count)]
+
+
 @pytest.mark.asyncio
 async def test_run_probe_with_hooks() -> None:
     """Test run_probe with on_check_start and on_check_end hooks."""
@@ -305,6 +341,311 @@ async def test_probe_asgi_timeout() -> None:
     assert status == UNHEALTHY_STATUS_CODE
 
 
+@pytest.mark.asyncio
+async def test_probe_asgi_cache_ttl_reuses_report() -> None:
+    """ProbeAsgi with cache_ttl reuses the last report until it expires."""
+    check = CountingCheck()
+    asgi_probe = ProbeAsgi(
+        Probe(name="test", checks=[check]),
+        options=build_probe_route_options(cache_ttl=60.0),
+    )
+    await asgi_probe()
+    await asgi_probe()
+    assert check.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_probe_asgi_cache_ttl_expires() -> None:
+    """ProbeAsgi re-runs checks once cache_ttl has elapsed."""
+    check = CountingCheck()
+    asgi_probe = ProbeAsgi(
+        Probe(name="test", checks=[check]),
+        options=build_probe_route_options(cache_ttl=0.01),
+    )
+    await asgi_probe()
+    await asyncio.sleep(0.05)
+    await asgi_probe()
+    assert check.calls == EXPECTED_RESULTS_COUNT
+
+
+@pytest.mark.asyncio
+async def test_probe_asgi_cache_ttl_single_flight() -> None:
+    """Concurrent ProbeAsgi calls share one in-flight run when cache_ttl is set."""
+    check = CountingCheck(delay=0.05)
+    asgi_probe = ProbeAsgi(
+        Probe(name="test", checks=[check]),
+        options=build_probe_route_options(cache_ttl=60.0),
+    )
+    responses = await asyncio.gather(*(asgi_probe() for _ in range(5)))
+    assert check.calls == 1
+    assert {status for _, _, status in responses} == {HTTPStatus.NO_CONTENT}
+
+
+@pytest.mark.asyncio
+async def test_probe_asgi_without_cache_ttl_runs_every_time() -> None:
+    """ProbeAsgi without cache_ttl runs checks on every call."""
+    check = CountingCheck()
+    asgi_probe = ProbeAsgi(Probe(name="test", checks=[check]))
+    await asgi_probe()
+    await asgi_probe()
+    assert check.calls == EXPECTED_RESULTS_COUNT
+
+
+@pytest.mark.asyncio
+async def test_probe_asgi_cache_ttl_reuses_encoded_response() -> None:
+    """ProbeAsgi with the default handler renders a cached report once and returns the same body afterwards."""
+    asgi_probe = ProbeAsgi(
+        Probe(name="test", checks=[CountingCheck()]),
+        options=build_probe_route_options(success_status=HTTPStatus.OK, cache_ttl=60.0),
+    )
+    with patch.object(ProbeAsgi, "_render", autospec=True, side_effect=ProbeAsgi._render) as render:
+        first = await asgi_probe()
+        second = await asgi_probe()
+    assert first == (
+        b'{"status":"healthy"}',
+        {"content-type": "application/json", "content-length": "20"},
+        HTTPStatus.OK,
+    )
+    assert second == first
+    assert second[1] is not first[1]
+    render.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"cache_ttl": 60.0},
+        {"background_interval": 60.0},
+    ],
+)
+@pytest.mark.asyncio
+async def test_probe_asgi_cached_report_calls_custom_handler_each_time(options: dict[str, float]) -> None:
+    """A custom handler runs on every request, even while the same cached report is served."""
+    check = CountingCheck()
+    handler_calls = 0
+
+    async def handler(response: ProbeAsgiResponse) -> dict[str, Any]:
+        nonlocal handler_calls
+        handler_calls += 1
+        await asyncio.sleep(0)
+        return {"healthy": response.healthy, "calls": handler_calls}
+
+    asgi_probe = ProbeAsgi(
+        Probe(name="test", checks=[check]),
+        options=build_probe_route_options(success_handler=handler, success_status=HTTPStatus.OK, **options),
+    )
+    bodies = [(await asgi_probe())[0] for _ in range(3)]
+    await asgi_probe.stop_polling()
+    assert check.calls == 1
+    assert bodies == [b'{"healthy":true,"calls":1}', b'{"healthy":true,"calls":2}', b'{"healthy":true,"calls":3}']
+
+
+@pytest.mark.asyncio
+async def test_probe_asgi_without_checks_renders_once() -> None:
+    """ProbeAsgi for a probe without checks and the default handler renders the response once."""
+    asgi_probe = ProbeAsgi(
+        Probe(name="liveness", checks=[]),
+        options=build_probe_route_options(success_status=HTTPStatus.OK),
+    )
+    with patch.object(ProbeAsgi, "_render", autospec=True, side_effect=ProbeAsgi._render) as render:
+        first = await asgi_probe()
+        second = await asgi_probe()
+    expected = (
+        b'{"status":"healthy"}',
+        {"content-type": "application/json", "content-length": "20"},
+        HTTPStatus.OK,
+    )
+    assert second == first == expected
+    assert second[1] is not first[1]
+    render.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_probe_asgi_without_checks_calls_custom_handler_each_time() -> None:
+    """ProbeAsgi for a probe without checks still calls a custom success handler on every request."""
+    handler_calls = 0
+
+    async def handler(response: ProbeAsgiResponse) -> dict[str, Any]:
+        nonlocal handler_calls
+        handler_calls += 1
+        await asyncio.sleep(0)
+        return {"healthy": response.healthy, "calls": handler_calls}
+
+    asgi_probe = ProbeAsgi(
+        Probe(name="liveness", checks=[]),
+        options=build_probe_route_options(success_handler=handler, success_status=HTTPStatus.OK),
+    )
+    first = await asgi_probe()
+    second = await asgi_probe()
+    assert first[0] == b'{"healthy":true,"calls":1}'
+    assert second[0] == b'{"healthy":true,"calls":2}'
+    assert handler_calls == 2  # noqa: PLR2004
+
+
+def test_build_probe_route_options_returns_shared_instance() -> None:
+    """build_probe_route_options returns one cached instance per argument set."""
+    options = build_probe_route_options(debug=True, prefix="/health")
+    assert build_probe_route_options(debug=True, prefix="/health") is options
+    assert build_probe_route_options(debug=False, prefix="/health") is not options
+
+
+@dataclass
+class _UnhashableHandler:
+    """Callable handler without __hash__ (non-frozen dataclass)."""
+
+    payload: dict[str, Any]
+
+    async def __call__(self, response: ProbeAsgiResponse) -> dict[str, Any]:  # noqa: ARG002
+        """Return the configured payload.
+
+        Returns:
+            The payload given at construction.
+        """
+        await asyncio.sleep(0)
+        return self.payload
+
+
+def test_build_probe_route_options_accepts_unhashable_handler() -> None:
+    """Unhashable handlers bypass the options cache instead of raising TypeError."""
+    handler = _UnhashableHandler({"ok": True})
+    options = build_probe_route_options(success_handler=handler, failure_handler=handler)
+    assert options.success_handler is handler
+    assert options.failure_handler is handler
+    assert build_probe_route_options(success_handler=handler) is not build_probe_route_options(
+        success_handler=handler,
+    )
+
+
+@pytest.mark.asyncio
+async def test_probe_asgi_no_content_skips_handler() -> None:
+    """ProbeAsgi does not build a payload or call the handler for 204 responses."""
+    handler = AsyncMock(return_value={"status": "healthy"})
+    asgi_probe = ProbeAsgi(
+        Probe(name="test", checks=[CountingCheck()]),
+        options=build_probe_route_options(success_handler=handler),
+    )
+    assert await asgi_probe() == (b"", None, HTTPStatus.NO_CONTENT)
+    handler.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    ("debug", "expected"),
+    [
+        (False, {"results": [{"name": "Counting", "healthy": True}]}),
+        (
+            True,
+            {
+                "results": [{"name": "Counting", "healthy": True, "error_details": None}],
+                "allow_partial_failure": False,
+            },
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_probe_asgi_response_data(*, debug: bool, expected: dict[str, Any]) -> None:
+    """ProbeAsgiResponse.data hides error details and partial-failure flag unless debug."""
+    seen: list[dict[str, Any]] = []
+
+    async def handler(response: ProbeAsgiResponse) -> None:
+        seen.append(response.data)
+        await asyncio.sleep(0)
+
+    asgi_probe = ProbeAsgi(
+        Probe(name="test", checks=[CountingCheck()]),
+        options=build_probe_route_options(success_handler=handler, success_status=HTTPStatus.OK, debug=debug),
+    )
+    await asgi_probe()
+    assert seen == [expected]
+
+
+@pytest.mark.asyncio
+async def test_probe_asgi_background_interval_serves_latest_report() -> None:
+    """ProbeAsgi with background_interval re-runs checks in the background."""
+    check = CountingCheck()
+    probe = Probe(name="test", checks=[check])
+    asgi_probe = ProbeAsgi(probe, options=build_probe_route_options(background_interval=0.01))
+    await asgi_probe()
+    assert check.calls >= 1
+    await asyncio.wait_for(check.wait_for_calls(EXPECTED_RESULTS_COUNT + 1), timeout=5.0)
+    await close_probes([probe])
+    calls_after_close = check.calls
+    await asyncio.sleep(0.05)
+    assert check.calls == calls_after_close
+
+
+@pytest.mark.asyncio
+async def test_probe_asgi_background_interval_does_not_wait_for_checks() -> None:
+    """Once a report exists, background-polled calls return it without waiting for checks."""
+    calls = 0
+    blocked = asyncio.Event()
+    release = asyncio.Event()
+
+    async def blocking_after_first() -> bool:
+        """Return at once on the first call, then block until released.
+
+        Returns:
+            True.
+        """
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            blocked.set()
+            await release.wait()
+        return True
+
+    check = FunctionHealthCheck(func=blocking_after_first, name="Blocking")
+    asgi_probe = ProbeAsgi(
+        Probe(name="test", checks=[check]),
+        options=build_probe_route_options(background_interval=0.01),
+    )
+    await asgi_probe()
+    await asyncio.wait_for(blocked.wait(), timeout=5.0)
+    # The background run is now blocked; the request must not wait for it.
+    _content, _headers, status = await asyncio.wait_for(asgi_probe(), timeout=5.0)
+    assert status == HTTPStatus.NO_CONTENT
+    release.set()
+    await asgi_probe.stop_polling()
+
+
+@pytest.mark.asyncio
+async def test_probe_asgi_stop_polling_lets_inflight_run_finish() -> None:
+    """stop_polling() does not cancel the in-flight run that a request is waiting for."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def gated_check() -> bool:
+        """Signal start, then wait to be released.
+
+        Returns:
+            True.
+        """
+        started.set()
+        await release.wait()
+        return True
+
+    asgi_probe = ProbeAsgi(
+        Probe(name="test", checks=[FunctionHealthCheck(func=gated_check, name="Gated")]),
+        options=build_probe_route_options(background_interval=60.0),
+    )
+    request = asyncio.ensure_future(asgi_probe())
+    await started.wait()
+    stop = asyncio.ensure_future(asgi_probe.stop_polling())
+    await asyncio.sleep(0)
+    assert not stop.done()
+    release.set()
+    await stop
+    _content, _headers, status = await request
+    assert status == HTTPStatus.NO_CONTENT
+
+
+@pytest.mark.parametrize("option", ["cache_ttl", "background_interval", "check_timeout"])
+@pytest.mark.parametrize("value", [0, -1.0])
+def test_build_probe_route_options_rejects_non_positive_values(option: str, value: float) -> None:
+    """build_probe_route_options raises ValueError for zero or negative intervals and timeouts."""
+    with pytest.raises(ValueError, match=f"{option} must be positive"):
+        build_probe_route_options(**{option: value})
+
+
 @pytest.mark.asyncio
 async def test_run_probe_timeout_raises() -> None:
     """run_probe raises TimeoutError when timeout is exceeded and no on_check hooks."""
@@ -326,6 +667,49 @@ async def test_run_probe_timeout_raises() -> None:
         await run_probe(probe, timeout=0.01)
 
 
+@pytest.mark.parametrize("with_hooks", [False, True])
+@pytest.mark.asyncio
+async def test_run_probe_check_timeout_fails_only_slow_check(*, with_hooks: bool) -> None:
+    """check_timeout fails the check that exceeds it and keeps the other results."""
+
+    async def on_check_start(_check: object, _index: int) -> None:
+        await asyncio.sleep(0)
+
+    probe = Probe(
+        name="test",
+        checks=[CountingCheck(delay=10.0), FunctionHealthCheck(func=lambda: True, name="Fast")],
+    )
+    report = await run_probe(
+        probe,
+        check_timeout=0.01,
+        on_check_start=on_check_start if with_hooks else None,
+    )
+    assert [(r.name, r.healthy, r.error_details) for r in report.results] == [
+        ("Counting", False, "Check timed out"),
+        ("Fast", True, None),
+    ]
+
+
+@pytest.mark.parametrize("with_hooks", [False, True])
+@pytest.mark.asyncio
+async def test_run_probe_runs_repeated_check_once(*, with_hooks: bool) -> None:
+    """A check instance listed twice runs once and its result fills both positions."""
+
+    async def on_check_start(_check: object, _index: int) -> None:
+        await asyncio.sleep(0)
+
+    shared = CountingCheck()
+    other = CountingCheck()
+    report = await run_probe(
+        Probe(name="test", checks=[shared, other, shared]),
+        on_check_start=on_check_start if with_hooks else None,
+    )
+    assert len(report.results) == 3  # noqa: PLR2004
+    assert report.results[0] is report.results[2]
+    assert shared.calls == 1
+    assert other.calls == 1
+
+
 @pytest.mark.asyncio
 async def test_run_probe_cancelled_error_propagates() -> None:
     """_run_check_safe re-raises CancelledError; never wraps in HealthCheckResult (CF-1)."""
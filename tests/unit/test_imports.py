@@ -1,6 +1,8 @@
 """Tests for optional-check import errors and install hints."""
 
 import importlib
+import subprocess
+import sys
 
 import pytest
 
@@ -48,3 +50,16 @@ def test_import_error_optional_check(module_path: str, message_substring: str) -
     """Importing optional check without extra raises ImportError with install hint."""
     with pytest.raises(ImportError, match=message_substring):
         importlib.import_module(module_path)
+
+
+@pytest.mark.unit
+def test_core_import_does_not_load_backend_drivers() -> None:
+    """Importing the package, configs and integrations base does not import any backend driver."""
+    drivers = ("aio_pika", "aiokafka", "asyncpg", "httpx", "motor", "opensearchpy", "psycopg", "redis")
+    code = (
+        "import sys\n"
+        "import fast_healthchecks, fast_healthchecks.checks, fast_healthchecks.integrations.base\n"
+        f"print(','.join(m for m in {drivers!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert not result.stdout.strip()
@@ -64,3 +64,11 @@ def test_healthcheck_report() -> None:
         allow_partial_failure=True,
     )
     assert hcr.healthy is False
+
+
+def test_models_use_slots() -> None:
+    """HealthCheckResult and HealthCheckReport are slotted (no per-instance __dict__)."""
+    result = HealthCheckResult(name="test", healthy=True)
+    report = HealthCheckReport(results=[result])
+    assert not hasattr(result, "__dict__")
+    assert not hasattr(report, "__dict__")